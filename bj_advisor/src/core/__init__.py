@@ -1,14 +1,18 @@
 """
 Core module initialization.
 """
-from .card import Rank, Card, Shoe
-from .hand import Hand, SplitHands
-from .rules import Rules, DEFAULT_RULES
+from .card import Rank, Card, CARDS, Shoe, CountInfo, RANK_SYMBOLS, BJ_VALUE, HI_LO, RANK_FROM_STR
+from .hand import (Hand, SplitHands, SIG_TOTAL_MASK, SIG_PAIR, SIG_SOFT,
+                   SIG_KIND_SHIFT, SIG_PAIR_VALUE_SHIFT)
+from .rules import Rules, DEFAULT_RULES, S17, NUM_DECKS, DOUBLE_AFTER_SPLIT, BLACKJACK_PAYOUT, MAX_SPLIT_HANDS
 from .table import Seat, DealerHand, Table
 
 __all__ = [
-    'Rank', 'Card', 'Shoe',
+    'Rank', 'Card', 'CARDS', 'Shoe', 'CountInfo',
+    'RANK_SYMBOLS', 'BJ_VALUE', 'HI_LO', 'RANK_FROM_STR',
     'Hand', 'SplitHands',
+    'SIG_TOTAL_MASK', 'SIG_PAIR', 'SIG_SOFT', 'SIG_KIND_SHIFT', 'SIG_PAIR_VALUE_SHIFT',
     'Rules', 'DEFAULT_RULES',
+    'S17', 'NUM_DECKS', 'DOUBLE_AFTER_SPLIT', 'BLACKJACK_PAYOUT', 'MAX_SPLIT_HANDS',
     'Seat', 'DealerHand', 'Table'
 ]
\ No newline at end of file
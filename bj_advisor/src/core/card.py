@@ -1,72 +1,101 @@
 """
 Card system implementation for blackjack advisor.
-Includes Rank enum, Card dataclass, and Shoe tracking.
+Includes integer rank codes, Card dataclass, and Shoe tracking.
 """
-from enum import Enum
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import List, NamedTuple, Optional
 import random
 
 
-class Rank(Enum):
-    """Card ranks with blackjack values."""
-    TWO = ("2", 2, 1)
-    THREE = ("3", 3, 1)
-    FOUR = ("4", 4, 1)
-    FIVE = ("5", 5, 1)
-    SIX = ("6", 6, 1)
-    SEVEN = ("7", 7, 0)
-    EIGHT = ("8", 8, 0)
-    NINE = ("9", 9, 0)
-    TEN = ("T", 10, -1)
-    JACK = ("J", 10, -1)
-    QUEEN = ("Q", 10, -1)
-    KING = ("K", 10, -1)
-    ACE = ("A", 11, -1)
-
-    def __init__(self, symbol: str, bj_value: int, hi_lo_value: int):
-        self.symbol = symbol
-        self.bj_value = bj_value
-        self.hi_lo_value = hi_lo_value
+# Rank codes index the lookup tables below (TWO=0 ... ACE=12)
+RANK_SYMBOLS = ("2", "3", "4", "5", "6", "7", "8", "9", "T", "J", "Q", "K", "A")
+BJ_VALUE = (2, 3, 4, 5, 6, 7, 8, 9, 10, 10, 10, 10, 11)
+HI_LO = (1, 1, 1, 1, 1, 0, 0, 0, -1, -1, -1, -1, -1)
+RANK_FROM_STR = {symbol: rank for rank, symbol in enumerate(RANK_SYMBOLS)}
+RANK_FROM_STR["10"] = RANK_FROM_STR["T"]
 
-    @classmethod
-    def from_string(cls, rank_str: str) -> 'Rank':
+
+class Rank:
+    """Card ranks as plain integer codes into the lookup tables."""
+    TWO = 0
+    THREE = 1
+    FOUR = 2
+    FIVE = 3
+    SIX = 4
+    SEVEN = 5
+    EIGHT = 6
+    NINE = 7
+    TEN = 8
+    JACK = 9
+    QUEEN = 10
+    KING = 11
+    ACE = 12
+
+    @staticmethod
+    def from_string(rank_str: str) -> int:
         """Parse rank from string (case insensitive)."""
         rank_str = rank_str.upper()
-        if rank_str == "10":
-            rank_str = "T"
-        
-        for rank in cls:
-            if rank.symbol == rank_str:
-                return rank
-        raise ValueError(f"Invalid rank: {rank_str}")
-
-    def __str__(self):
-        return self.symbol
+        rank = RANK_FROM_STR.get(rank_str)
+        if rank is None:
+            raise ValueError(f"Invalid rank: {rank_str}")
+        return rank
 
 
-@dataclass
+@dataclass(frozen=True, slots=True, init=False)
 class Card:
-    """Playing card with Hi-Lo counting value."""
-    rank: Rank
+    """Playing card with Hi-Lo counting value (immutable).
+    
+    Cards are interned: Card(rank) always returns the instance in CARDS for
+    that rank, so cards can be compared by identity.
+    """
+    rank: int
+
+    def __new__(cls, rank: int) -> 'Card':
+        if not isinstance(rank, int) or not 0 <= rank < len(RANK_SYMBOLS):
+            raise ValueError(f"Invalid rank code: {rank!r}")
+        return CARDS[rank]
+
+    @classmethod
+    def _create(cls, rank: int) -> 'Card':
+        """Build a new instance; only used to fill CARDS."""
+        card = object.__new__(cls)
+        object.__setattr__(card, 'rank', rank)
+        return card
+
+    def __reduce__(self):
+        return (Card, (self.rank,))
 
     @property
     def hi_lo_value(self) -> int:
         """Hi-Lo counting value: +1 for 2-6, 0 for 7-9, -1 for T-A."""
-        return self.rank.hi_lo_value
+        return HI_LO[self.rank]
 
     @property
     def value(self) -> int:
         """Blackjack value of the card."""
-        return self.rank.bj_value
+        return BJ_VALUE[self.rank]
 
     def __str__(self):
-        return str(self.rank)
+        return RANK_SYMBOLS[self.rank]
 
     @classmethod
     def from_string(cls, card_str: str) -> 'Card':
-        """Create card from string representation."""
-        return cls(Rank.from_string(card_str))
+        """Get the canonical card for a string representation."""
+        return CARDS[Rank.from_string(card_str)]
+
+
+# The interned card for every rank code, indexed by rank
+CARDS = tuple(Card._create(rank) for rank in range(len(RANK_SYMBOLS)))
+
+
+class CountInfo(NamedTuple):
+    """Snapshot of the shoe's count metrics."""
+    running_count: int
+    true_count: float
+    decks_remaining: float
+    cards_dealt: int
+    cards_remaining: int
+    penetration: float  # Percent of the shoe dealt
 
 
 class Shoe:
@@ -75,55 +104,97 @@ class Shoe:
     def __init__(self, num_decks: int = 6, penetration_threshold: float = 0.75):
         self.num_decks = num_decks
         self.penetration_threshold = penetration_threshold
-        self.cards_dealt: List[Card] = []
+        # Cards dealt per rank code; the shoe never stores Card objects
+        self.dealt_counts: List[int] = [0] * len(RANK_SYMBOLS)
+        self._dealt_n = 0
         self.running_count = 0
+        self._total_cards = num_decks * 52
+        self._update_derived()
+    
+    def _update_derived(self) -> None:
+        """Recompute cached count values after the shoe changes."""
+        self._count_info: Optional[CountInfo] = None
+        self._decks_remaining = (self._total_cards - self._dealt_n) / 52.0
+        if self._decks_remaining > 0:
+            self._true_count = self.running_count / self._decks_remaining
+        else:
+            self._true_count = 0.0
+    
+    @property
+    def num_dealt(self) -> int:
+        """Number of cards dealt from shoe."""
+        return self._dealt_n
         
     @property
     def cards_remaining(self) -> int:
         """Number of cards remaining in shoe."""
-        total_cards = self.num_decks * 52
-        return total_cards - len(self.cards_dealt)
+        return self._total_cards - self._dealt_n
     
     @property
     def decks_remaining(self) -> float:
         """Approximate number of decks remaining."""
-        return self.cards_remaining / 52.0
+        return self._decks_remaining
     
     @property
     def true_count(self) -> float:
         """True count (running count / decks remaining)."""
-        if self.decks_remaining <= 0:
-            return 0.0
-        return self.running_count / self.decks_remaining
+        return self._true_count
     
     @property
     def penetration(self) -> float:
         """Percentage of cards dealt from shoe."""
-        total_cards = self.num_decks * 52
-        return len(self.cards_dealt) / total_cards
+        return self._dealt_n / self._total_cards
     
     @property
     def needs_shuffle(self) -> bool:
         """True if penetration threshold exceeded."""
         return self.penetration >= self.penetration_threshold
     
+    def deal_rank(self, rank: int) -> None:
+        """Record a card of the given rank code being dealt."""
+        self.dealt_counts[rank] += 1
+        self._dealt_n += 1
+        self.running_count += HI_LO[rank]
+        self._update_derived()
+    
     def deal_card(self, card: Card) -> None:
         """Record a card being dealt and update running count."""
-        self.cards_dealt.append(card)
-        self.running_count += card.hi_lo_value
+        self.deal_rank(card.rank)
+    
+    def undeal_card(self, card: Card) -> bool:
+        """Take back a dealt card and restore the running count.
+        
+        Returns:
+            True if a card of that rank had been dealt and was removed
+        """
+        if not self.dealt_counts[card.rank]:
+            return False
+        self.dealt_counts[card.rank] -= 1
+        self._dealt_n -= 1
+        self.running_count -= HI_LO[card.rank]
+        self._update_derived()
+        return True
     
     def shuffle(self) -> None:
-        """Reset shoe to beginning."""
-        self.cards_dealt.clear()
+        """Reset shoe to beginning, reusing the per-rank counts list."""
+        self.dealt_counts[:] = [0] * len(RANK_SYMBOLS)
+        self._dealt_n = 0
         self.running_count = 0
+        self._update_derived()
     
-    def get_count_info(self) -> dict:
-        """Get comprehensive count information."""
-        return {
-            "running_count": self.running_count,
-            "true_count": round(self.true_count, 2),
-            "decks_remaining": round(self.decks_remaining, 1),
-            "cards_dealt": len(self.cards_dealt),
-            "cards_remaining": self.cards_remaining,
-            "penetration": round(self.penetration * 100, 1)
-        }
\ No newline at end of file
+    def get_count_info(self) -> CountInfo:
+        """Get comprehensive count information.
+        
+        The same CountInfo is returned until the next card is dealt,
+        taken back or the shoe is shuffled.
+        """
+        if self._count_info is None:
+            self._count_info = CountInfo(
+                running_count=self.running_count,
+                true_count=round(self._true_count, 2),
+                decks_remaining=round(self._decks_remaining, 1),
+                cards_dealt=self._dealt_n,
+                cards_remaining=self._total_cards - self._dealt_n,
+                penetration=round(self._dealt_n / self._total_cards * 100, 1),
+            )
+        return self._count_info
\ No newline at end of file
@@ -2,87 +2,144 @@
 Hand evaluation for blackjack advisor.
 Handles soft/hard totals, pairs, blackjack detection, and bust detection.
 """
-from dataclasses import dataclass
-from typing import List, Optional, Tuple
-from .card import Card, Rank
+from array import array
+from typing import List, Optional
+from .card import Card, CARDS, Rank, BJ_VALUE, RANK_SYMBOLS
+from .rules import MAX_SPLIT_HANDS
+
+
+# Card value with aces counted as 1, by rank code
+LOW_VALUE = tuple(1 if rank == Rank.ACE else BJ_VALUE[rank]
+                  for rank in range(len(RANK_SYMBOLS)))
+
+# Hand.sig layout: total in the low byte, then the pair and soft flags (so
+# `sig >> SIG_KIND_SHIFT` is soft * 2 + pair), and the pair's card value
+SIG_TOTAL_MASK = 0xFF
+SIG_PAIR = 1 << 8
+SIG_SOFT = 1 << 9
+SIG_KIND_SHIFT = 8
+SIG_PAIR_VALUE_SHIFT = 12
 
 
-@dataclass
 class Hand:
-    """Blackjack hand with soft/hard evaluation."""
-    cards: List[Card]
+    """Blackjack hand with soft/hard evaluation.
+    
+    Cards are stored as a compact array of rank codes; the `cards` list is
+    built from the shared Card instances on demand. The total, softness and
+    ace count are kept up to date as cards are added and removed.
+    """
     
     def __init__(self, cards: Optional[List[Card]] = None):
-        self.cards = cards or []
+        self._ranks = array('b', [card.rank for card in cards or ()])
+        # Total with every ace counted as 1
+        self._low_total = sum(LOW_VALUE[rank] for rank in self._ranks)
+        self._ace_count = self._ranks.count(Rank.ACE)
+        self._update_total()
+    
+    def _update_total(self) -> None:
+        """Derive the best total and softness from the running sums.
+        
+        A single ace is promoted to 11 with arithmetic rather than a branch.
+        """
+        soft = int((self._ace_count > 0) & (self._low_total + 10 <= 21))
+        self._total = self._low_total + 10 * soft
+        self._soft = bool(soft)
+        # Packed signature is rebuilt on next use
+        self._sig: Optional[int] = None
+    
+    def add_rank(self, rank: int) -> None:
+        """Add a card to the hand by rank code."""
+        self._ranks.append(rank)
+        self._low_total += LOW_VALUE[rank]
+        if rank == Rank.ACE:
+            self._ace_count += 1
+        self._update_total()
     
     def add_card(self, card: Card) -> None:
         """Add a card to the hand."""
-        self.cards.append(card)
+        self.add_rank(card.rank)
+    
+    def pop_card(self) -> Card:
+        """Remove and return the last card added to the hand."""
+        rank = self._ranks.pop()
+        self._low_total -= LOW_VALUE[rank]
+        if rank == Rank.ACE:
+            self._ace_count -= 1
+        self._update_total()
+        return CARDS[rank]
+    
+    @property
+    def cards(self) -> List[Card]:
+        """Cards in the hand, in the order they were added."""
+        return [CARDS[rank] for rank in self._ranks]
+    
+    @property
+    def num_cards(self) -> int:
+        """Number of cards in the hand."""
+        return len(self._ranks)
     
     @property
     def is_empty(self) -> bool:
         """True if hand has no cards."""
-        return len(self.cards) == 0
+        return not self._ranks
     
     @property
     def is_pair(self) -> bool:
         """True if hand is exactly two cards of same rank."""
-        return (len(self.cards) == 2 and 
-                self.cards[0].rank.bj_value == self.cards[1].rank.bj_value)
+        ranks = self._ranks
+        return len(ranks) == 2 and BJ_VALUE[ranks[0]] == BJ_VALUE[ranks[1]]
     
     @property
-    def pair_rank(self) -> Optional[Rank]:
+    def pair_rank(self) -> Optional[int]:
         """Return the rank if this is a pair, None otherwise."""
         if self.is_pair:
-            return self.cards[0].rank
+            return self._ranks[0]
+        return None
+    
+    @property
+    def pair_value(self) -> Optional[int]:
+        """Blackjack value (2-11) of the paired cards, None if not a pair."""
+        ranks = self._ranks
+        if len(ranks) == 2:
+            value = BJ_VALUE[ranks[0]]
+            if value == BJ_VALUE[ranks[1]]:
+                return value
         return None
     
     @property
     def has_ace(self) -> bool:
         """True if hand contains at least one Ace."""
-        return any(card.rank == Rank.ACE for card in self.cards)
+        return self.ace_count > 0
     
     @property
     def ace_count(self) -> int:
         """Number of Aces in hand."""
-        return sum(1 for card in self.cards if card.rank == Rank.ACE)
-    
-    def _calculate_total(self) -> Tuple[int, bool]:
-        """Calculate hand total and whether it's soft.
-        
-        Returns:
-            Tuple of (total, is_soft)
-        """
-        if not self.cards:
-            return 0, False
-        
-        # Count non-ace cards
-        total = sum(card.value for card in self.cards if card.rank != Rank.ACE)
-        aces = self.ace_count
-        
-        if aces == 0:
-            return total, False
-        
-        # Start with all aces as 1
-        total += aces
-        
-        # Try to make one ace worth 11 if it doesn't bust
-        if total + 10 <= 21:
-            return total + 10, True
-        else:
-            return total, False
+        return self._ace_count
     
     @property
     def total(self) -> int:
         """Best possible total for the hand."""
-        total, _ = self._calculate_total()
-        return total
+        return self._total
     
     @property
     def is_soft(self) -> bool:
         """True if hand total includes an Ace counted as 11."""
-        _, soft = self._calculate_total()
-        return soft
+        return self._soft
+    
+    @property
+    def sig(self) -> int:
+        """Total, softness and pair state packed into one int.
+        
+        See the SIG_* constants for the layout; two hands with the same sig
+        get the same strategy decision against the same upcard.
+        """
+        if self._sig is None:
+            pair_value = self.pair_value
+            sig = self._total | (SIG_SOFT if self._soft else 0)
+            if pair_value is not None:
+                sig |= SIG_PAIR | (pair_value << SIG_PAIR_VALUE_SHIFT)
+            self._sig = sig
+        return self._sig
     
     @property
     def is_hard(self) -> bool:
@@ -92,7 +149,7 @@ class Hand:
     @property
     def is_blackjack(self) -> bool:
         """True if hand is natural blackjack (21 with exactly 2 cards)."""
-        return len(self.cards) == 2 and self.total == 21
+        return len(self._ranks) == 2 and self.total == 21
     
     @property
     def is_busted(self) -> bool:
@@ -102,7 +159,7 @@ class Hand:
     @property
     def can_double(self) -> bool:
         """True if hand is eligible for doubling (exactly 2 cards)."""
-        return len(self.cards) == 2
+        return len(self._ranks) == 2
     
     @property
     def can_split(self) -> bool:
@@ -115,7 +172,7 @@ class Hand:
             return "Empty hand"
         
         if self.is_pair:
-            return f"Pair of {self.pair_rank.symbol}s"
+            return f"Pair of {RANK_SYMBOLS[self.pair_rank]}s"
         elif self.is_soft:
             return f"Soft {self.total}"
         else:
@@ -123,7 +180,7 @@ class Hand:
     
     def card_string(self) -> str:
         """String representation of cards in hand."""
-        return ",".join(str(card) for card in self.cards)
+        return ",".join([RANK_SYMBOLS[rank] for rank in self._ranks])
     
     def __str__(self):
         """String representation of hand."""
@@ -140,25 +197,48 @@ class Hand:
         else:
             return f"[{cards_str}] - {description}"
     
+    def __repr__(self):
+        return f"Hand(cards={self.cards!r})"
+    
+    def __eq__(self, other):
+        if not isinstance(other, Hand):
+            return NotImplemented
+        return self._ranks == other._ranks
+    
     def copy(self) -> 'Hand':
         """Create a copy of this hand."""
-        return Hand(self.cards.copy())
+        return Hand(self.cards)
 
 
 class SplitHands:
-    """Container for managing split hands."""
+    """Container for managing a seat's hands (a single hand until split)."""
     
     def __init__(self, original_hand: Hand):
         if not original_hand.can_split:
             raise ValueError("Cannot split non-pair hand")
         
         # Create two hands, each with one card from the original pair
-        self.hands = [
+        self._set_hands([
             Hand([original_hand.cards[0]]),
             Hand([original_hand.cards[1]])
-        ]
+        ])
+    
+    @classmethod
+    def single(cls, hand: Hand) -> 'SplitHands':
+        """Create a container holding one unsplit hand."""
+        split_hands = cls.__new__(cls)
+        split_hands._set_hands([hand])
+        return split_hands
+    
+    def _set_hands(self, hands: List[Hand]) -> None:
+        """Initialize container state with the given hands."""
+        self.hands = hands
         self.current_hand_index = 0
-        self.completed_hands = set()
+        # Bit i set when hand i is complete (at most MAX_SPLIT_HANDS hands)
+        self._completed_mask = 0
+        self._completed_count = 0
+        # Bumped by every change made through this container
+        self.version = 0
     
     @property
     def current_hand(self) -> Hand:
@@ -173,26 +253,31 @@ class SplitHands:
     @property
     def is_complete(self) -> bool:
         """True if all hands are complete."""
-        return len(self.completed_hands) == len(self.hands)
+        return self._completed_count == len(self.hands)
     
     def add_card_to_current(self, card: Card) -> None:
         """Add card to currently active hand."""
         self.current_hand.add_card(card)
+        self.version += 1
     
     def complete_current_hand(self) -> None:
         """Mark current hand as complete and move to next."""
-        self.completed_hands.add(self.current_hand_index)
+        self.version += 1
+        bit = 1 << self.current_hand_index
+        if not self._completed_mask & bit:
+            self._completed_mask |= bit
+            self._completed_count += 1
         
         # Find next incomplete hand
         for i in range(len(self.hands)):
-            if i not in self.completed_hands:
+            if not (self._completed_mask >> i) & 1:
                 self.current_hand_index = i
                 return
     
     def can_split_current(self) -> bool:
         """True if current hand can be split further."""
         return (self.current_hand.can_split and 
-                len(self.hands) < 4)  # Max 4 hands
+                len(self.hands) < MAX_SPLIT_HANDS)
     
     def split_current(self) -> None:
         """Split the current hand into two new hands."""
@@ -208,4 +293,5 @@ class SplitHands:
         new_hand2 = Hand([current.cards[1]])
         
         self.hands[self.current_hand_index] = new_hand1
-        self.hands.insert(self.current_hand_index + 1, new_hand2)
\ No newline at end of file
+        self.hands.insert(self.current_hand_index + 1, new_hand2)
+        self.version += 1
\ No newline at end of file
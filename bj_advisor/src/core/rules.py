@@ -4,9 +4,9 @@ Game rules configuration for blackjack advisor.
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Rules:
-    """Blackjack game rules configuration."""
+    """Blackjack game rules configuration (immutable)."""
     
     # Dealer rules
     dealer_stands_soft_17: bool = True  # S17 rules
@@ -48,4 +48,11 @@ DEFAULT_RULES = Rules(
     max_split_hands=4,
     split_aces_one_card=True,
     penetration_threshold=0.75
-)
\ No newline at end of file
+)
+
+# Default rules as plain constants for hot paths that never switch rules
+S17 = DEFAULT_RULES.dealer_stands_soft_17
+NUM_DECKS = DEFAULT_RULES.num_decks
+DOUBLE_AFTER_SPLIT = DEFAULT_RULES.double_after_split
+BLACKJACK_PAYOUT = DEFAULT_RULES.blackjack_payout
+MAX_SPLIT_HANDS = DEFAULT_RULES.max_split_hands
@@ -3,8 +3,8 @@ Table state management for blackjack advisor.
 Tracks multiple seats, dealer cards, and game state.
 """
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Union
-from .card import Card, Shoe, Rank
+from typing import Dict, List, Optional
+from .card import Card, CARDS, CountInfo, Shoe, Rank
 from .hand import Hand, SplitHands
 from .rules import Rules, DEFAULT_RULES
 
@@ -13,71 +13,62 @@ from .rules import Rules, DEFAULT_RULES
 class Seat:
     """Player seat at blackjack table."""
     seat_id: str
-    hands: Union[Hand, SplitHands]
+    hands: SplitHands
     is_user: bool = False
     is_active: bool = True
     
     def __init__(self, seat_id: str, is_user: bool = False):
         self.seat_id = seat_id
-        self.hands = Hand()
+        self.hands = SplitHands.single(Hand())
         self.is_user = is_user
         self.is_active = True
     
     @property
     def primary_hand(self) -> Hand:
         """Get the primary (or only) hand for this seat."""
-        if isinstance(self.hands, SplitHands):
-            return self.hands.current_hand
-        return self.hands
+        return self.hands.current_hand
     
     @property
     def all_hands(self) -> List[Hand]:
         """Get all hands for this seat (list for splits)."""
-        if isinstance(self.hands, SplitHands):
-            return self.hands.all_hands
-        return [self.hands]
+        return self.hands.all_hands
     
     @property
     def has_splits(self) -> bool:
         """True if this seat has split hands."""
-        return isinstance(self.hands, SplitHands)
+        return len(self.hands.hands) > 1
     
     def add_card(self, card: Card) -> None:
         """Add card to current hand."""
-        if isinstance(self.hands, SplitHands):
-            self.hands.add_card_to_current(card)
-        else:
-            self.hands.add_card(card)
+        self.hands.add_card_to_current(card)
     
     def split_hand(self) -> None:
         """Split the current hand."""
-        if isinstance(self.hands, SplitHands):
-            if self.hands.can_split_current():
-                self.hands.split_current()
-            else:
-                raise ValueError("Cannot split current hand further")
+        if self.hands.can_split_current():
+            self.hands.split_current()
+        elif self.has_splits:
+            raise ValueError("Cannot split current hand further")
         else:
-            if self.hands.can_split:
-                self.hands = SplitHands(self.hands)
-            else:
-                raise ValueError("Hand cannot be split")
+            raise ValueError("Hand cannot be split")
     
     def can_split(self) -> bool:
         """True if current hand can be split."""
-        if isinstance(self.hands, SplitHands):
-            return self.hands.can_split_current()
-        return self.hands.can_split
+        return self.hands.can_split_current()
+    
+    def reset_hands(self) -> None:
+        """Start over with a single empty hand."""
+        self.hands = SplitHands.single(Hand())
     
     def describe_hands(self) -> str:
         """Description of all hands at this seat."""
-        if isinstance(self.hands, SplitHands):
+        if self.has_splits:
             descriptions = []
             for i, hand in enumerate(self.hands.all_hands):
                 marker = " *" if i == self.hands.current_hand_index else ""
                 descriptions.append(f"  Hand {i+1}: {hand}{marker}")
             return "\n".join(descriptions)
         else:
-            return f"  {self.hands}"
+            return f"  {self.hands.current_hand}"
 
 
 class DealerHand:
@@ -87,22 +78,54 @@ class DealerHand:
         self.upcard: Optional[Card] = None
         self.hole_card: Optional[Card] = None
         self.hit_cards: List[Card] = []
+        # Maintained incrementally as cards arrive
+        self._hand = Hand()
     
     @property
     def all_cards(self) -> List[Card]:
         """All dealer cards."""
+        return self._hand.cards
+    
+    @property
+    def hand(self) -> Hand:
+        """Dealer hand as Hand object."""
+        return self._hand
+    
+    def set_upcard(self, card: Card) -> None:
+        """Set the dealer upcard."""
+        self.upcard = card
+        self._hand.add_card(card)
+    
+    def set_hole_card(self, card: Card) -> None:
+        """Set the dealer hole card."""
+        self.hole_card = card
+        self._hand.add_card(card)
+    
+    def clear_upcard(self) -> None:
+        """Remove the dealer upcard."""
+        self.upcard = None
+        self._rebuild_hand()
+    
+    def clear_hole_card(self) -> None:
+        """Remove the dealer hole card."""
+        self.hole_card = None
+        self._rebuild_hand()
+    
+    def pop_hit_card(self) -> Card:
+        """Remove and return the last dealer hit card."""
+        card = self.hit_cards.pop()
+        self._rebuild_hand()
+        return card
+    
+    def _rebuild_hand(self) -> None:
+        """Rebuild the dealer hand after a card is taken back."""
         cards = []
         if self.upcard:
             cards.append(self.upcard)
         if self.hole_card:
             cards.append(self.hole_card)
         cards.extend(self.hit_cards)
-        return cards
-    
-    @property
-    def hand(self) -> Hand:
-        """Dealer hand as Hand object."""
-        return Hand(self.all_cards)
+        self._hand = Hand(cards)
     
     @property
     def shows_ace(self) -> bool:
@@ -114,15 +137,21 @@ class DealerHand:
         """Value of dealer upcard."""
         return self.upcard.value if self.upcard else None
     
+    def add_hit_rank(self, rank: int) -> None:
+        """Add a hit card to dealer hand by rank code."""
+        self.hit_cards.append(CARDS[rank])
+        self._hand.add_rank(rank)
+    
     def add_hit_card(self, card: Card) -> None:
         """Add a hit card to dealer hand."""
-        self.hit_cards.append(card)
+        self.add_hit_rank(card.rank)
     
     def reset(self) -> None:
         """Reset dealer hand for new round."""
         self.upcard = None
         self.hole_card = None
         self.hit_cards.clear()
+        self._hand = Hand()
     
     def describe(self) -> str:
         """Description of dealer hand."""
@@ -137,8 +166,7 @@ class DealerHand:
             cards_str += f",{hit_str}"
         
         if self.hole_card or self.hit_cards:
-            total = self.hand.total
-            description = self.hand.describe()
+            description = self._hand.describe()
             return f"Dealer: [{cards_str}] - {description}"
         else:
             return f"Dealer: [{cards_str},?]"
@@ -152,17 +180,29 @@ class Table:
         self.shoe = Shoe(rules.num_decks, rules.penetration_threshold)
         self.dealer = DealerHand()
         self.seats: Dict[str, Seat] = {}
+        # Seats in seating (dealing) order, for index-based access
+        self._seat_list: List[Seat] = []
         self.user_seat_id: Optional[str] = None
         self.round_active = False
+        # Rendered status, reused until a table mutator runs, a seat's hands
+        # change version, or the shoe's count changes (cards popped straight
+        # off a Hand on undo always move the shoe too)
+        self._status_dirty = True
+        self._status_cache = ''
+        self._status_count_info: Optional[CountInfo] = None
+        self._status_seat_versions: tuple = ()
     
     def add_seat(self, seat_id: str, is_user: bool = False) -> None:
         """Add a player seat to the table."""
         if seat_id in self.seats:
             raise ValueError(f"Seat {seat_id} already exists")
         
-        self.seats[seat_id] = Seat(seat_id, is_user)
+        seat = Seat(seat_id, is_user)
+        self.seats[seat_id] = seat
+        self._seat_list.append(seat)
         if is_user:
             self.user_seat_id = seat_id
+        self._status_dirty = True
     
     def get_user_seat(self) -> Optional[Seat]:
         """Get the user's seat."""
@@ -177,15 +217,17 @@ class Table:
         
         # Reset all hands
         self.dealer.reset()
-        for seat in self.seats.values():
-            seat.hands = Hand()
+        for seat in self._seat_list:
+            seat.reset_hands()
             seat.is_active = True
         
         self.round_active = True
+        self._status_dirty = True
     
     def end_round(self) -> None:
         """End current round."""
         self.round_active = False
+        self._status_dirty = True
     
     def add_card_to_player(self, seat_id: str, card: Card) -> None:
         """Add card to player hand and update shoe."""
@@ -194,27 +236,58 @@ class Table:
         
         self.seats[seat_id].add_card(card)
         self.shoe.deal_card(card)
+        self._status_dirty = True
+    
+    def add_card_to_player_fast(self, index: int, card: Card) -> None:
+        """Add card to the player at a seating position without validation."""
+        self._seat_list[index].add_card(card)
+        self.shoe.deal_card(card)
+        self._status_dirty = True
     
     def add_dealer_upcard(self, card: Card) -> None:
         """Add dealer upcard."""
         if self.dealer.upcard:
             raise ValueError("Dealer upcard already set")
         
-        self.dealer.upcard = card
+        self.dealer.set_upcard(card)
         self.shoe.deal_card(card)
+        self._status_dirty = True
     
     def add_dealer_hole_card(self, card: Card) -> None:
         """Add dealer hole card."""
         if self.dealer.hole_card:
             raise ValueError("Dealer hole card already set")
         
-        self.dealer.hole_card = card
+        self.dealer.set_hole_card(card)
+        self.shoe.deal_card(card)
+        self._status_dirty = True
+    
+    def add_dealer_upcard_fast(self, card: Card) -> None:
+        """Add dealer upcard without checking one is already set."""
+        self.dealer.set_upcard(card)
+        self.shoe.deal_card(card)
+        self._status_dirty = True
+    
+    def add_dealer_hole_card_fast(self, card: Card) -> None:
+        """Add dealer hole card without checking one is already set."""
+        self.dealer.set_hole_card(card)
         self.shoe.deal_card(card)
+        self._status_dirty = True
     
     def add_dealer_hit_card(self, card: Card) -> None:
         """Add dealer hit card."""
         self.dealer.add_hit_card(card)
         self.shoe.deal_card(card)
+        self._status_dirty = True
+    
+    def add_card_to_split(self, seat_id: str, hand_index: int, card: Card) -> None:
+        """Add card to one of a player's split hands and update shoe."""
+        if seat_id not in self.seats:
+            raise ValueError(f"Seat {seat_id} not found")
+        
+        self.seats[seat_id].all_hands[hand_index].add_card(card)
+        self.shoe.deal_card(card)
+        self._status_dirty = True
     
     def split_player_hand(self, seat_id: str) -> None:
         """Split player hand."""
@@ -222,6 +295,7 @@ class Table:
             raise ValueError(f"Seat {seat_id} not found")
         
         self.seats[seat_id].split_hand()
+        self._status_dirty = True
     
     def can_take_insurance(self) -> bool:
         """True if insurance is available (dealer shows Ace)."""
@@ -229,27 +303,36 @@ class Table:
     
     def get_status(self) -> str:
         """Get comprehensive table status."""
+        count_info = self.shoe.get_count_info()
+        seat_versions = tuple((seat.hands, seat.hands.version) for seat in self._seat_list)
+        if (not self._status_dirty and count_info is self._status_count_info
+                and seat_versions == self._status_seat_versions):
+            return self._status_cache
+        
         lines = []
         
         # Shoe info
-        count_info = self.shoe.get_count_info()
-        lines.append(f"Count: RC {count_info['running_count']:+d}, "
-                    f"TC {count_info['true_count']:+.1f}, "
-                    f"Decks Remaining: {count_info['decks_remaining']}")
-        lines.append(f"Cards: {count_info['cards_dealt']}/{count_info['cards_dealt'] + count_info['cards_remaining']} "
-                    f"({count_info['penetration']:.1f}% penetration)")
+        lines.append(f"Count: RC {count_info.running_count:+d}, "
+                    f"TC {count_info.true_count:+.1f}, "
+                    f"Decks Remaining: {count_info.decks_remaining}")
+        lines.append(f"Cards: {count_info.cards_dealt}/{count_info.cards_dealt + count_info.cards_remaining} "
+                    f"({count_info.penetration:.1f}% penetration)")
         
         # Dealer
         lines.append("")
         lines.append(self.dealer.describe())
         
         # Players
-        if self.seats:
+        if self._seat_list:
             lines.append("")
             lines.append("Players:")
-            for seat_id, seat in self.seats.items():
+            for seat in self._seat_list:
                 user_marker = " (USER)" if seat.is_user else ""
-                lines.append(f"{seat_id}{user_marker}:")
+                lines.append(f"{seat.seat_id}{user_marker}:")
                 lines.append(seat.describe_hands())
         
-        return "\n".join(lines)
\ No newline at end of file
+        self._status_cache = "\n".join(lines)
+        self._status_count_info = count_info
+        self._status_seat_versions = seat_versions
+        self._status_dirty = False
+        return self._status_cache
\ No newline at end of file
@@ -1,12 +1,13 @@
 """
 Strategy module initialization.
 """
-from .basic_strategy import Action, BasicStrategy
-from .index_plays import IndexPlay, IndexPlays
-from .advisor import Advisor
+from .basic_strategy import Action, BasicStrategy, HIT, STAND, DOUBLE, SPLIT, to_action, get_basic_strategy
+from .index_plays import IndexPlay, IndexPlays, get_index_plays
+from .advisor import Advisor, AdviceResult
 
 __all__ = [
     'Action', 'BasicStrategy',
-    'IndexPlay', 'IndexPlays',
-    'Advisor'
+    'HIT', 'STAND', 'DOUBLE', 'SPLIT', 'to_action', 'get_basic_strategy',
+    'IndexPlay', 'IndexPlays', 'get_index_plays',
+    'Advisor', 'AdviceResult'
 ]
\ No newline at end of file
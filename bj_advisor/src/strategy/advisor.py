@@ -2,21 +2,97 @@
 Advisor implementation that combines basic strategy and index plays.
 Provides comprehensive advice with count-based deviations.
 """
-from typing import Optional, Dict, Any
-from ..core import Hand, Table
-from .basic_strategy import BasicStrategy, Action
-from .index_plays import IndexPlays
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, Sequence, Tuple
+from ..core import Hand, Table, Shoe, S17
+from .basic_strategy import Action, get_basic_strategy
+from .index_plays import IndexPlay, get_index_plays
+from .ev import remaining_counts, hand_evs
+
+# Reasoning labels for pairs (by card value) and soft totals
+PAIR_DESC = {value: "A,A" if value == 11 else f"{value},{value}" for value in range(2, 12)}
+SOFT_DESC = {total: f"A,{total - 11}" for total in range(11, 22)}
+
+# Fixed reasoning fragments, built once instead of per advice
+DEALER_DESC = {value: "dealer A" if value == 11 else f"dealer {value}" for value in range(12)}
+ACTION_UPPER = {action: action.value.upper() for action in Action}
+
+
+@lru_cache(maxsize=None)
+def _deviation_prefix(index_play: IndexPlay) -> str:
+    """Count-deviation reasoning up to the current count, per index play."""
+    threshold = index_play.true_count_threshold
+    threshold_desc = f"TC ≥ {threshold:+.1f}" if threshold >= 0 else f"TC ≤ {threshold:.1f}"
+    return f"🎯 COUNT DEVIATION: {index_play.name} ({threshold_desc}) - Current "
+
+# Keys every advice result has when read like the old dict
+_ADVICE_KEYS = ('action', 'basic_strategy', 'count_influenced', 'true_count',
+                'count_display', 'reasoning')
+
+
+@dataclass(slots=True)
+class AdviceResult:
+    """Strategy advice for one hand.
+    
+    The reasoning text is only formatted when first read. Read-only mapping
+    access (advice['action'], 'deviation' in advice, dict(advice)) is kept
+    for callers written against the old dict; 'deviation' is only a key
+    when the count changed the play.
+    """
+    action: Action
+    basic_strategy: Action
+    count_influenced: bool
+    true_count: float
+    count_display: str
+    # Advisor._get_reasoning arguments, captured when the advice is made
+    _reasoning_args: Tuple = field(repr=False)
+    deviation: Optional[str] = None
+    _reasoning: Optional[str] = field(default=None, repr=False)
+    
+    @property
+    def reasoning(self) -> str:
+        """Human-readable explanation of the recommendation."""
+        if self._reasoning is None:
+            self._reasoning = Advisor._get_reasoning(*self._reasoning_args)
+        return self._reasoning
+    
+    def keys(self) -> List[str]:
+        """Keys of the old advice dict, in its order."""
+        if self.deviation is None:
+            return list(_ADVICE_KEYS)
+        return [*_ADVICE_KEYS, 'deviation']
+    
+    def __contains__(self, key: object) -> bool:
+        return key in _ADVICE_KEYS or (key == 'deviation' and self.deviation is not None)
+    
+    def __iter__(self):
+        return iter(self.keys())
+    
+    def __getitem__(self, key: str) -> Any:
+        if key not in self:
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+    
+    def __str__(self) -> str:
+        return self.reasoning
 
 
 class Advisor:
     """Complete blackjack advisor combining basic strategy and index plays."""
     
     def __init__(self):
-        self.basic_strategy = BasicStrategy()
-        self.index_plays = IndexPlays()
+        self.basic_strategy = get_basic_strategy()
+        self.index_plays = get_index_plays()
     
     def get_advice(self, hand: Hand, dealer_upcard_value: int, true_count: float, 
-                   can_double: bool = True, can_split: bool = False) -> Dict[str, Any]:
+                   can_double: bool = True, can_split: bool = False) -> AdviceResult:
         """Get comprehensive strategy advice including count-based deviations."""
         
         # Get basic strategy recommendation first
@@ -34,12 +110,12 @@ class Advisor:
         deviation_reason = index_play.name if index_play else None
         
         # Validate action based on game state
-        if not can_double and final_action == Action.DOUBLE:
+        if not can_double and final_action is Action.DOUBLE:
             final_action = Action.HIT
             if count_influenced:
                 deviation_reason += " (hit instead of double - can't double)"
         
-        if not (can_split and hand.is_pair) and final_action == Action.SPLIT:
+        if not (can_split and hand.is_pair) and final_action is Action.SPLIT:
             final_action = Action.STAND if hand.total >= 17 else Action.HIT
             if count_influenced:
                 deviation_reason += " (can't split - using backup action)"
@@ -47,40 +123,59 @@ class Advisor:
         # Format true count display
         count_display = f"{true_count:+.1f}" if true_count >= 0 else f"{true_count:.1f}"
         
-        # Create advice response
-        advice = {
-            'action': final_action,
-            'basic_strategy': basic_advice,
-            'count_influenced': count_influenced,
-            'true_count': true_count,
-            'count_display': count_display,
-            'reasoning': self._get_reasoning(hand, dealer_upcard_value, basic_advice, 
-                                           index_play, final_action, true_count)
-        }
+        # Hand description is read now since the hand may change before
+        # the reasoning is formatted
+        hand_desc = self._format_hand_description(hand)
+        return AdviceResult(
+            action=final_action,
+            basic_strategy=basic_advice,
+            count_influenced=count_influenced,
+            true_count=true_count,
+            count_display=count_display,
+            deviation=deviation_reason,
+            _reasoning_args=(hand_desc, dealer_upcard_value, basic_advice,
+                             index_play, final_action, true_count),
+        )
+    
+    def get_advice_batch(self, hands: Sequence[Hand], dealer_upcard_value: int,
+                         true_count: float, can_double: bool = True,
+                         can_split: bool = False) -> List[Action]:
+        """Get the recommended action for several hands against one upcard.
+        
+        Applies the same deviations and game-state checks as get_advice but
+        skips building reasoning text, so it suits advising every seat at once.
         
-        if deviation_reason:
-            advice['deviation'] = deviation_reason
+        Returns:
+            Actions in the same order as `hands`
+        """
+        get_action = self.basic_strategy.get_action
+        get_index_action = self.index_plays.get_index_action
+        
+        actions = []
+        for hand in hands:
+            basic_action = get_action(hand, dealer_upcard_value, can_double)
+            action, _ = get_index_action(hand, dealer_upcard_value, true_count, basic_action)
             
-        return advice
+            if action is Action.DOUBLE and not can_double:
+                action = Action.HIT
+            elif action is Action.SPLIT and not (can_split and hand.is_pair):
+                action = Action.STAND if hand.total >= 17 else Action.HIT
+            actions.append(action)
+        return actions
     
-    def _get_reasoning(self, hand: Hand, dealer_upcard: int, basic_action: Action,
-                      index_play: Optional, final_action: Action, 
-                      true_count: float) -> str:
+    @staticmethod
+    def _get_reasoning(hand_desc: str, dealer_upcard: int, basic_action: Action,
+                       index_play: Optional, final_action: Action, 
+                       true_count: float) -> str:
         """Generate detailed reasoning for the recommendation."""
         
-        hand_desc = self._format_hand_description(hand)
-        dealer_desc = f"dealer {dealer_upcard}" if dealer_upcard != 11 else "dealer A"
         count_desc = f"TC {true_count:+.1f}" if true_count >= 0 else f"TC {true_count:.1f}"
         
         if index_play:
             # Count-based deviation
-            threshold = index_play.true_count_threshold
-            threshold_desc = f"TC ≥ {threshold:+.1f}" if threshold >= 0 else f"TC ≤ {threshold:.1f}"
-            
             return (
-                f"🎯 COUNT DEVIATION: {index_play.name} "
-                f"({threshold_desc}) - Current {count_desc} triggers "
-                f"{final_action.value.upper()} vs basic {basic_action.value.upper()}"
+                f"{_deviation_prefix(index_play)}{count_desc} triggers "
+                f"{ACTION_UPPER[final_action]} vs basic {ACTION_UPPER[basic_action]}"
             )
         else:
             # Basic strategy
@@ -89,22 +184,27 @@ class Advisor:
             else:
                 count_note = f" (Count {count_desc} neutral)"
                 
-            return f"📚 BASIC STRATEGY: {hand_desc} vs {dealer_desc} = {final_action.value.upper()}{count_note}"
+            return (f"📚 BASIC STRATEGY: {hand_desc} vs {DEALER_DESC[dealer_upcard]} = "
+                    f"{ACTION_UPPER[final_action]}{count_note}")
     
     def _format_hand_description(self, hand: Hand) -> str:
         """Format hand description for display."""
         if hand.is_pair:
-            card_value = hand.cards[0].value
-            if card_value == 11:
-                return "A,A"
-            else:
-                return f"{card_value},{card_value}"
+            return PAIR_DESC[hand.pair_value]
         elif hand.is_soft:
-            non_ace_total = hand.total - 11
-            return f"A,{non_ace_total}"
+            return SOFT_DESC[hand.total]
         else:
             return str(hand.total)
     
+    def get_expected_values(self, hand: Hand, dealer_upcard_value: int, shoe: Shoe,
+                            dealer_stands_soft_17: bool = S17) -> Dict[str, float]:
+        """Get stand/hit/double EVs for the current shoe composition.
+        
+        The shoe must already include the hand's cards and the dealer upcard.
+        """
+        counts = remaining_counts(shoe.dealt_counts, shoe.num_decks)
+        return hand_evs(hand, dealer_upcard_value, counts, dealer_stands_soft_17)
+    
     def get_insurance_advice(self, true_count: float) -> Dict[str, Any]:
         """Get advice for insurance decision."""
         should_take = true_count >= self.index_plays.insurance_threshold
@@ -3,8 +3,8 @@ Basic strategy implementation for blackjack advisor.
 Complete S17 lookup tables for hard totals, soft totals, and pairs.
 """
 from enum import Enum
-from typing import Dict, Tuple, Optional
-from ..core import Rank, Hand
+from functools import lru_cache
+from ..core import Hand, SIG_TOTAL_MASK, SIG_SOFT, SIG_PAIR_VALUE_SHIFT
 
 
 class Action(Enum):
@@ -15,73 +15,129 @@ class Action(Enum):
     SPLIT = "Split"
     
     def __str__(self):
-        return self.value
+        # _value_ is a plain attribute; .value goes through a descriptor
+        return self._value_
+
+
+# Dense strategy table dimensions: totals 0-21 by dealer upcards 0-11
+TABLE_TOTALS = 22
+TABLE_UPCARDS = 12
+
+# Integer action codes used inside the tables; Action is for display
+HIT, STAND, DOUBLE, SPLIT = 0, 1, 2, 3
+ACTIONS = (Action.HIT, Action.STAND, Action.DOUBLE, Action.SPLIT)
+ACTION_NAMES = tuple(action.value for action in ACTIONS)
+ACTION_ORD = {action: code for code, action in enumerate(ACTIONS)}
+
+# bytes.translate map that turns DOUBLE cells into HIT
+_NO_DOUBLE = bytes.maketrans(bytes([DOUBLE]), bytes([HIT]))
+
+
+def to_action(code: int) -> Action:
+    """Convert an integer action code to its Action."""
+    return ACTIONS[code]
+
+
+# Strategy charts, one string per row with a letter per dealer upcard 2-A:
+# H = hit, S = stand, D = double, P = split
+HARD_FIRST = 5
+HARD_TOTALS = (
+    "HHHHHHHHHH",  # 5
+    "HHHHHHHHHH",  # 6
+    "HHHHHHHHHH",  # 7
+    "HHHHHHHHHH",  # 8
+    "HDDDDHHHHH",  # 9
+    "DDDDDDDDHH",  # 10
+    "DDDDDDDDDD",  # 11
+    "HHSSSHHHHH",  # 12
+    "SSSSSHHHHH",  # 13
+    "SSSSSHHHHH",  # 14
+    "SSSSSHHHHH",  # 15
+    "SSSSSHHHHH",  # 16
+    "SSSSSSSSSS",  # 17
+    "SSSSSSSSSS",  # 18
+    "SSSSSSSSSS",  # 19
+    "SSSSSSSSSS",  # 20
+    "SSSSSSSSSS",  # 21
+)
+
+SOFT_FIRST = 13
+SOFT_TOTALS = (
+    "HHHDDHHHHH",  # A,2
+    "HHHDDHHHHH",  # A,3
+    "HHDDDHHHHH",  # A,4
+    "HHDDDHHHHH",  # A,5
+    "HDDDDHHHHH",  # A,6
+    "SDDDDSSHHH",  # A,7
+    "SSSSSSSSSS",  # A,8
+    "SSSSSSSSSS",  # A,9
+    "SSSSSSSSSS",  # A,10
+)
+
+# Rows by pair card value (all 10-value cards share the 10s row)
+PAIR_FIRST = 2
+PAIRS = (
+    "HHPPPPHHHH",  # 2,2
+    "HHPPPPHHHH",  # 3,3
+    "HHHPPHHHHH",  # 4,4
+    "DDDDDDDDHH",  # 5,5 (never split)
+    "HPPPPHHHHH",  # 6,6
+    "PPPPPPHHHH",  # 7,7
+    "PPPPPPPPPP",  # 8,8 (always split)
+    "PPPPPSPPSS",  # 9,9
+    "SSSSSSSSSS",  # 10,10 (never split)
+    "PPPPPPPPPP",  # A,A (always split)
+)
+
+# bytes.translate map from chart letters to action codes
+_CHART_CODES = bytes.maketrans(b"HSDP", bytes((HIT, STAND, DOUBLE, SPLIT)))
 
 
 class BasicStrategy:
     """Complete basic strategy tables for S17 rules."""
     
-    def __init__(self):
-        self._init_hard_totals()
-        self._init_soft_totals()
-        self._init_pairs()
-    
-    def _init_hard_totals(self):
-        """Initialize hard total strategy table."""
-        # Hard totals vs dealer upcard (2-A)
-        # Format: {player_total: {dealer_upcard_value: action}}
-        self.hard_totals: Dict[int, Dict[int, Action]] = {
-            5: {2: Action.HIT, 3: Action.HIT, 4: Action.HIT, 5: Action.HIT, 6: Action.HIT, 7: Action.HIT, 8: Action.HIT, 9: Action.HIT, 10: Action.HIT, 11: Action.HIT},
-            6: {2: Action.HIT, 3: Action.HIT, 4: Action.HIT, 5: Action.HIT, 6: Action.HIT, 7: Action.HIT, 8: Action.HIT, 9: Action.HIT, 10: Action.HIT, 11: Action.HIT},
-            7: {2: Action.HIT, 3: Action.HIT, 4: Action.HIT, 5: Action.HIT, 6: Action.HIT, 7: Action.HIT, 8: Action.HIT, 9: Action.HIT, 10: Action.HIT, 11: Action.HIT},
-            8: {2: Action.HIT, 3: Action.HIT, 4: Action.HIT, 5: Action.HIT, 6: Action.HIT, 7: Action.HIT, 8: Action.HIT, 9: Action.HIT, 10: Action.HIT, 11: Action.HIT},
-            9: {2: Action.HIT, 3: Action.DOUBLE, 4: Action.DOUBLE, 5: Action.DOUBLE, 6: Action.DOUBLE, 7: Action.HIT, 8: Action.HIT, 9: Action.HIT, 10: Action.HIT, 11: Action.HIT},
-            10: {2: Action.DOUBLE, 3: Action.DOUBLE, 4: Action.DOUBLE, 5: Action.DOUBLE, 6: Action.DOUBLE, 7: Action.DOUBLE, 8: Action.DOUBLE, 9: Action.DOUBLE, 10: Action.HIT, 11: Action.HIT},
-            11: {2: Action.DOUBLE, 3: Action.DOUBLE, 4: Action.DOUBLE, 5: Action.DOUBLE, 6: Action.DOUBLE, 7: Action.DOUBLE, 8: Action.DOUBLE, 9: Action.DOUBLE, 10: Action.DOUBLE, 11: Action.DOUBLE},
-            12: {2: Action.HIT, 3: Action.HIT, 4: Action.STAND, 5: Action.STAND, 6: Action.STAND, 7: Action.HIT, 8: Action.HIT, 9: Action.HIT, 10: Action.HIT, 11: Action.HIT},
-            13: {2: Action.STAND, 3: Action.STAND, 4: Action.STAND, 5: Action.STAND, 6: Action.STAND, 7: Action.HIT, 8: Action.HIT, 9: Action.HIT, 10: Action.HIT, 11: Action.HIT},
-            14: {2: Action.STAND, 3: Action.STAND, 4: Action.STAND, 5: Action.STAND, 6: Action.STAND, 7: Action.HIT, 8: Action.HIT, 9: Action.HIT, 10: Action.HIT, 11: Action.HIT},
-            15: {2: Action.STAND, 3: Action.STAND, 4: Action.STAND, 5: Action.STAND, 6: Action.STAND, 7: Action.HIT, 8: Action.HIT, 9: Action.HIT, 10: Action.HIT, 11: Action.HIT},
-            16: {2: Action.STAND, 3: Action.STAND, 4: Action.STAND, 5: Action.STAND, 6: Action.STAND, 7: Action.HIT, 8: Action.HIT, 9: Action.HIT, 10: Action.HIT, 11: Action.HIT},
-            17: {2: Action.STAND, 3: Action.STAND, 4: Action.STAND, 5: Action.STAND, 6: Action.STAND, 7: Action.STAND, 8: Action.STAND, 9: Action.STAND, 10: Action.STAND, 11: Action.STAND},
-            18: {2: Action.STAND, 3: Action.STAND, 4: Action.STAND, 5: Action.STAND, 6: Action.STAND, 7: Action.STAND, 8: Action.STAND, 9: Action.STAND, 10: Action.STAND, 11: Action.STAND},
-            19: {2: Action.STAND, 3: Action.STAND, 4: Action.STAND, 5: Action.STAND, 6: Action.STAND, 7: Action.STAND, 8: Action.STAND, 9: Action.STAND, 10: Action.STAND, 11: Action.STAND},
-            20: {2: Action.STAND, 3: Action.STAND, 4: Action.STAND, 5: Action.STAND, 6: Action.STAND, 7: Action.STAND, 8: Action.STAND, 9: Action.STAND, 10: Action.STAND, 11: Action.STAND},
-            21: {2: Action.STAND, 3: Action.STAND, 4: Action.STAND, 5: Action.STAND, 6: Action.STAND, 7: Action.STAND, 8: Action.STAND, 9: Action.STAND, 10: Action.STAND, 11: Action.STAND},
-        }
+    # Charts are immutable, so every instance shares them
+    hard_totals = HARD_TOTALS
+    soft_totals = SOFT_TOTALS
+    pairs = PAIRS
     
-    def _init_soft_totals(self):
-        """Initialize soft total strategy table."""
-        # Soft totals vs dealer upcard (2-A)
-        # Format: {player_total: {dealer_upcard_value: action}}
-        self.soft_totals: Dict[int, Dict[int, Action]] = {
-            13: {2: Action.HIT, 3: Action.HIT, 4: Action.HIT, 5: Action.DOUBLE, 6: Action.DOUBLE, 7: Action.HIT, 8: Action.HIT, 9: Action.HIT, 10: Action.HIT, 11: Action.HIT},  # A,2
-            14: {2: Action.HIT, 3: Action.HIT, 4: Action.HIT, 5: Action.DOUBLE, 6: Action.DOUBLE, 7: Action.HIT, 8: Action.HIT, 9: Action.HIT, 10: Action.HIT, 11: Action.HIT},  # A,3
-            15: {2: Action.HIT, 3: Action.HIT, 4: Action.DOUBLE, 5: Action.DOUBLE, 6: Action.DOUBLE, 7: Action.HIT, 8: Action.HIT, 9: Action.HIT, 10: Action.HIT, 11: Action.HIT},  # A,4
-            16: {2: Action.HIT, 3: Action.HIT, 4: Action.DOUBLE, 5: Action.DOUBLE, 6: Action.DOUBLE, 7: Action.HIT, 8: Action.HIT, 9: Action.HIT, 10: Action.HIT, 11: Action.HIT},  # A,5
-            17: {2: Action.HIT, 3: Action.DOUBLE, 4: Action.DOUBLE, 5: Action.DOUBLE, 6: Action.DOUBLE, 7: Action.HIT, 8: Action.HIT, 9: Action.HIT, 10: Action.HIT, 11: Action.HIT},  # A,6
-            18: {2: Action.STAND, 3: Action.DOUBLE, 4: Action.DOUBLE, 5: Action.DOUBLE, 6: Action.DOUBLE, 7: Action.STAND, 8: Action.STAND, 9: Action.HIT, 10: Action.HIT, 11: Action.HIT},  # A,7
-            19: {2: Action.STAND, 3: Action.STAND, 4: Action.STAND, 5: Action.STAND, 6: Action.STAND, 7: Action.STAND, 8: Action.STAND, 9: Action.STAND, 10: Action.STAND, 11: Action.STAND},  # A,8
-            20: {2: Action.STAND, 3: Action.STAND, 4: Action.STAND, 5: Action.STAND, 6: Action.STAND, 7: Action.STAND, 8: Action.STAND, 9: Action.STAND, 10: Action.STAND, 11: Action.STAND},  # A,9
-            21: {2: Action.STAND, 3: Action.STAND, 4: Action.STAND, 5: Action.STAND, 6: Action.STAND, 7: Action.STAND, 8: Action.STAND, 9: Action.STAND, 10: Action.STAND, 11: Action.STAND},  # A,10
-        }
+    def __init__(self):
+        self._freeze_tables()
     
-    def _init_pairs(self):
-        """Initialize pair strategy table."""
-        # Pairs vs dealer upcard (2-A)
-        # Format: {pair_value: {dealer_upcard_value: action}}
-        self.pairs: Dict[int, Dict[int, Action]] = {
-            2: {2: Action.HIT, 3: Action.HIT, 4: Action.SPLIT, 5: Action.SPLIT, 6: Action.SPLIT, 7: Action.SPLIT, 8: Action.HIT, 9: Action.HIT, 10: Action.HIT, 11: Action.HIT},    # 2,2
-            3: {2: Action.HIT, 3: Action.HIT, 4: Action.SPLIT, 5: Action.SPLIT, 6: Action.SPLIT, 7: Action.SPLIT, 8: Action.HIT, 9: Action.HIT, 10: Action.HIT, 11: Action.HIT},    # 3,3
-            4: {2: Action.HIT, 3: Action.HIT, 4: Action.HIT, 5: Action.SPLIT, 6: Action.SPLIT, 7: Action.HIT, 8: Action.HIT, 9: Action.HIT, 10: Action.HIT, 11: Action.HIT},       # 4,4
-            5: {2: Action.DOUBLE, 3: Action.DOUBLE, 4: Action.DOUBLE, 5: Action.DOUBLE, 6: Action.DOUBLE, 7: Action.DOUBLE, 8: Action.DOUBLE, 9: Action.DOUBLE, 10: Action.HIT, 11: Action.HIT},  # 5,5 (never split)
-            6: {2: Action.HIT, 3: Action.SPLIT, 4: Action.SPLIT, 5: Action.SPLIT, 6: Action.SPLIT, 7: Action.HIT, 8: Action.HIT, 9: Action.HIT, 10: Action.HIT, 11: Action.HIT},    # 6,6
-            7: {2: Action.SPLIT, 3: Action.SPLIT, 4: Action.SPLIT, 5: Action.SPLIT, 6: Action.SPLIT, 7: Action.SPLIT, 8: Action.HIT, 9: Action.HIT, 10: Action.HIT, 11: Action.HIT}, # 7,7
-            8: {2: Action.SPLIT, 3: Action.SPLIT, 4: Action.SPLIT, 5: Action.SPLIT, 6: Action.SPLIT, 7: Action.SPLIT, 8: Action.SPLIT, 9: Action.SPLIT, 10: Action.SPLIT, 11: Action.SPLIT}, # 8,8 (always split)
-            9: {2: Action.SPLIT, 3: Action.SPLIT, 4: Action.SPLIT, 5: Action.SPLIT, 6: Action.SPLIT, 7: Action.STAND, 8: Action.SPLIT, 9: Action.SPLIT, 10: Action.STAND, 11: Action.STAND}, # 9,9
-            10: {2: Action.STAND, 3: Action.STAND, 4: Action.STAND, 5: Action.STAND, 6: Action.STAND, 7: Action.STAND, 8: Action.STAND, 9: Action.STAND, 10: Action.STAND, 11: Action.STAND}, # 10,10 (never split)
-            11: {2: Action.SPLIT, 3: Action.SPLIT, 4: Action.SPLIT, 5: Action.SPLIT, 6: Action.SPLIT, 7: Action.SPLIT, 8: Action.SPLIT, 9: Action.SPLIT, 10: Action.SPLIT, 11: Action.SPLIT}, # A,A (always split)
-        }
+    def _freeze_tables(self):
+        """Pack the charts into dense [total][dealer_upcard] byte tables.
+        
+        Rows cover totals 0-21 and columns dealer upcards 0-11; each cell is
+        an action code. Cells outside a chart hold HIT, and soft totals
+        without a chart row fall back to the hard row.
+        """
+        def dense(chart, first, fallback=None):
+            rows = []
+            for total in range(TABLE_TOTALS):
+                if first <= total < first + len(chart):
+                    # Upcards 0 and 1 never occur; leave them as HIT
+                    row = chart[total - first].encode().translate(_CHART_CODES)
+                    rows.append(bytes(2) + row)
+                elif fallback is not None:
+                    rows.append(fallback[total])
+                else:
+                    rows.append(bytes(TABLE_UPCARDS))  # All HIT (code 0)
+            return tuple(rows)
+        
+        hard = dense(HARD_TOTALS, HARD_FIRST)
+        soft = dense(SOFT_TOTALS, SOFT_FIRST, hard)
+        pair = dense(PAIRS, PAIR_FIRST)
+        
+        def no_double(table):
+            return tuple(row.translate(_NO_DOUBLE) for row in table)
+        
+        # Fused [can_double][kind][total][dealer_upcard] with kind 0=hard,
+        # 1=soft, 2=pair (pair rows are by card value). Hands that can't
+        # double read copies with DOUBLE made HIT; pairs keep their chart.
+        self._table = (
+            (no_double(hard), no_double(soft), pair),
+            (hard, soft, pair),
+        )
     
     def get_action(self, hand: Hand, dealer_upcard_value: int, can_double: bool = True) -> Action:
         """Get basic strategy action for a hand.
@@ -94,50 +150,31 @@ class BasicStrategy:
         Returns:
             Recommended action
         """
+        return ACTIONS[self.get_action_code(hand, dealer_upcard_value, can_double)]
+    
+    def get_action_code(self, hand: Hand, dealer_upcard_value: int, can_double: bool = True) -> int:
+        """Get basic strategy action for a hand as an integer code (HIT, STAND, ...)."""
         if hand.is_busted:
-            return Action.STAND  # No action needed for busted hands
+            return STAND  # No action needed for busted hands
         
         if hand.is_blackjack:
-            return Action.STAND  # Stand on blackjack
+            return STAND  # Stand on blackjack
         
-        # Handle pairs first
-        if hand.is_pair:
-            pair_value = hand.pair_rank.bj_value
-            if pair_value == 11:  # Aces
-                pair_value = 11
-            elif pair_value == 10:  # All 10-value cards treated as 10s
-                pair_value = 10
-            
-            if pair_value in self.pairs:
-                action = self.pairs[pair_value].get(dealer_upcard_value, Action.HIT)
-                return action
-        
-        # Handle soft totals
-        if hand.is_soft:
-            total = hand.total
-            if total in self.soft_totals:
-                action = self.soft_totals[total].get(dealer_upcard_value, Action.HIT)
-                # Convert double to hit if doubling not allowed
-                if action == Action.DOUBLE and not can_double:
-                    return Action.HIT
-                return action
-        
-        # Handle hard totals
-        total = hand.total
-        if total in self.hard_totals:
-            action = self.hard_totals[total].get(dealer_upcard_value, Action.HIT)
-            # Convert double to hit if doubling not allowed
-            if action == Action.DOUBLE and not can_double:
-                return Action.HIT
-            return action
-        
-        # Default for very low totals
-        if total < 5:
-            return Action.HIT
-        
-        # Default fallback
-        return Action.HIT
+        # Pairs use their own rows (all 10-value cards share the 10s row)
+        sig = hand.sig
+        pair_value = sig >> SIG_PAIR_VALUE_SHIFT
+        if pair_value:
+            kind, row = 2, pair_value
+        else:
+            kind, row = (1 if sig & SIG_SOFT else 0), sig & SIG_TOTAL_MASK
+        return self._table[can_double][kind][row][dealer_upcard_value]
     
     def should_take_insurance(self, dealer_shows_ace: bool) -> bool:
         """Basic strategy for insurance (always no for basic strategy)."""
-        return False  # Never take insurance in basic strategy
\ No newline at end of file
+        return False  # Never take insurance in basic strategy
+
+
+@lru_cache(maxsize=None)
+def get_basic_strategy() -> BasicStrategy:
+    """Shared BasicStrategy instance; the basic strategy tables are built once per process."""
+    return BasicStrategy()
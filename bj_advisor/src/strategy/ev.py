@@ -0,0 +1,152 @@
+"""
+Composition-dependent expected values for count-aware advice.
+Dealer outcomes are computed exactly from the cards left in the shoe.
+"""
+from typing import Dict, List, Sequence
+from ..core import Hand, BJ_VALUE, S17
+
+# Dealer final-total slots: 17, 18, 19, 20, 21, bust
+BUST = 5
+
+# Card values in the order of the remaining-count buckets (2-9, ten, ace)
+_BUCKET_VALUES = (2, 3, 4, 5, 6, 7, 8, 9, 10, 11)
+_ACE_BUCKET = 9
+
+
+def remaining_counts(dealt_counts: Sequence[int], num_decks: int) -> List[int]:
+    """Collapse a shoe's per-rank dealt counts into remaining cards per value.
+
+    Returns:
+        Ten counts for values 2-9, ten-value cards and aces
+    """
+    remaining = [0] * len(_BUCKET_VALUES)
+    for rank, dealt in enumerate(dealt_counts):
+        remaining[BJ_VALUE[rank] - 2] += 4 * num_decks - dealt
+    return remaining
+
+
+def _dealer_draw(total: int, aces: int, counts: List[int], left: int,
+                 s17: bool, weight: float, out: List[float]) -> None:
+    """Recurse over dealer draws, accumulating outcome probabilities.
+
+    `total` counts every ace as 1. `counts` is decremented in place while a
+    card is drawn and restored afterwards.
+    """
+    best = total + 10 if aces and total + 10 <= 21 else total
+    if best > 21:
+        out[BUST] += weight
+        return
+    if best >= 17 and not (best == 17 and best != total and not s17):
+        out[best - 17] += weight
+        return
+
+    for bucket, value in enumerate(_BUCKET_VALUES):
+        count = counts[bucket]
+        if not count:
+            continue
+        counts[bucket] = count - 1
+        if bucket == _ACE_BUCKET:
+            _dealer_draw(total + 1, aces + 1, counts, left - 1, s17,
+                         weight * count / left, out)
+        else:
+            _dealer_draw(total + value, aces, counts, left - 1, s17,
+                         weight * count / left, out)
+        counts[bucket] = count
+
+
+def dealer_probabilities(upcard_value: int, counts: List[int],
+                         s17: bool = S17) -> List[float]:
+    """Probability of each dealer final total given the upcard.
+
+    Args:
+        upcard_value: Dealer's upcard value (2-11, where 11 = Ace)
+        counts: Remaining cards per value bucket (see remaining_counts)
+        s17: Whether the dealer stands on soft 17
+
+    Returns:
+        Probabilities for [17, 18, 19, 20, 21, bust]. Not conditioned on
+        the dealer having checked for blackjack.
+    """
+    out = [0.0] * 6
+    left = sum(counts)
+    if left == 0:
+        return out
+
+    if upcard_value == 11:
+        _dealer_draw(1, 1, counts, left, s17, 1.0, out)
+    else:
+        _dealer_draw(upcard_value, 0, counts, left, s17, 1.0, out)
+    return out
+
+
+def stand_ev(player_total: int, dealer_probs: List[float]) -> float:
+    """Expected value of standing on a total against dealer outcomes."""
+    if player_total > 21:
+        return -1.0
+
+    ev = dealer_probs[BUST]
+    for slot in range(5):
+        dealer_total = 17 + slot
+        if player_total > dealer_total:
+            ev += dealer_probs[slot]
+        elif player_total < dealer_total:
+            ev -= dealer_probs[slot]
+    return ev
+
+
+def hand_evs(hand: Hand, upcard_value: int, counts: List[int],
+             s17: bool = S17) -> Dict[str, float]:
+    """Expected values of standing, hitting and doubling a hand.
+
+    Player draws use the current composition without further removal;
+    hitting assumes the best of hit/stand after every card.
+
+    Returns:
+        Dictionary with 'stand', 'hit' and 'double' EVs per unit bet
+    """
+    dealer_probs = dealer_probabilities(upcard_value, counts, s17)
+    left = sum(counts)
+
+    # Player state as (total with aces as 1, ace count)
+    aces = hand.ace_count
+    hard_total = hand.total - 10 if hand.is_soft else hand.total
+
+    memo: Dict[tuple, float] = {}
+
+    def best_total(total: int, aces: int) -> int:
+        return total + 10 if aces and total + 10 <= 21 else total
+
+    def after_card_ev(total: int, aces: int, hit_again: bool) -> float:
+        ev = 0.0
+        for bucket, value in enumerate(_BUCKET_VALUES):
+            count = counts[bucket]
+            if not count:
+                continue
+            if bucket == _ACE_BUCKET:
+                new_total, new_aces = total + 1, aces + 1
+            else:
+                new_total, new_aces = total + value, aces
+            if hit_again:
+                ev += count * best_ev(new_total, new_aces)
+            else:
+                ev += count * stand_ev(best_total(new_total, new_aces), dealer_probs)
+        return ev / left
+
+    def best_ev(total: int, aces: int) -> float:
+        if total > 21:
+            return -1.0
+        key = (total, aces > 0)
+        if key not in memo:
+            memo[key] = max(stand_ev(best_total(total, aces), dealer_probs),
+                            after_card_ev(total, aces, True))
+        return memo[key]
+
+    if left == 0:
+        stand = stand_ev(hand.total, dealer_probs)
+        return {'stand': stand, 'hit': stand, 'double': stand}
+
+    return {
+        'stand': stand_ev(hand.total, dealer_probs),
+        'hit': after_card_ev(hard_total, aces, True),
+        'double': 2.0 * after_card_ev(hard_total, aces, False),
+    }
@@ -2,15 +2,30 @@
 Index plays implementation for blackjack advisor.
 Illustrious 18 (no surrender) count-based deviations.
 """
-from dataclasses import dataclass
-from typing import List, Optional
-from ..core import Hand
-from .basic_strategy import Action
+from functools import lru_cache
+from typing import List, NamedTuple, Optional, Tuple
+from ..core import Hand, SIG_TOTAL_MASK, SIG_KIND_SHIFT
+from .basic_strategy import Action, TABLE_TOTALS, TABLE_UPCARDS
 
 
-@dataclass
-class IndexPlay:
-    """Individual index play with count threshold."""
+def _threshold_met(threshold: float, true_count: float) -> bool:
+    """Positive thresholds trigger at or above, negative at or below."""
+    if threshold >= 0:
+        return true_count >= threshold
+    return true_count <= threshold
+
+
+def _trigger(threshold: float) -> Tuple[int, float]:
+    """Precompute a threshold's sign so the test is `sign * tc >= bound`.
+    
+    A negative threshold's `tc <= threshold` becomes `-tc >= -threshold`.
+    """
+    sign = 1 if threshold >= 0 else -1
+    return sign, sign * threshold
+
+
+class IndexPlay(NamedTuple):
+    """Individual index play with count threshold (immutable)."""
     name: str
     description: str
     player_total: int
@@ -21,48 +36,10 @@ class IndexPlay:
     basic_action: Action
     index_action: Action
     
-    def applies(self, hand: Hand, dealer_upcard_value: int, true_count: float) -> bool:
-        """Check if this index play applies to the current situation."""
-        # Check hand total
-        if hand.total != self.player_total:
-            return False
-        
-        # Check dealer upcard
-        if dealer_upcard_value != self.dealer_upcard:
-            return False
-        
-        # Check soft/hard
-        if self.is_soft and not hand.is_soft:
-            return False
-        if not self.is_soft and hand.is_soft:
-            return False
-        
-        # Check pair
-        if self.is_pair and not hand.is_pair:
-            return False
-        if not self.is_pair and hand.is_pair:
-            return False
-        
-        # CRITICAL FIX: Handle both positive AND negative count thresholds
-        # For positive thresholds: apply when count >= threshold
-        # For negative thresholds: apply when count <= threshold
-        if self.true_count_threshold >= 0:
-            return true_count >= self.true_count_threshold
-        else:
-            return true_count <= self.true_count_threshold
-    
     def get_action(self, true_count: float) -> Action:
         """Get the action for this index play given the true count."""
-        # CRITICAL FIX: Proper logic for positive and negative deviations
-        if self.true_count_threshold >= 0:
-            # Positive deviation: use index action when count is high enough
-            if true_count >= self.true_count_threshold:
-                return self.index_action
-        else:
-            # Negative deviation: use index action when count is low enough
-            if true_count <= self.true_count_threshold:
-                return self.index_action
-                
+        if _threshold_met(self.true_count_threshold, true_count):
+            return self.index_action
         return self.basic_action
 
 
@@ -395,15 +372,59 @@ class IndexPlays:
         
         # Insurance threshold (most important index play)
         self.insurance_threshold = 3.0  # Take insurance at TC ≥ +3
+        
+        self._build_deviation_table()
+    
+    def _build_deviation_table(self) -> None:
+        """Index plays by [soft*2 + pair][player_total][dealer_upcard].
+        
+        Each (hand type, total, upcard) situation has at most one play, so
+        finding the candidate deviation is a direct lookup.
+        """
+        table = [[[None] * TABLE_UPCARDS for _ in range(TABLE_TOTALS)]
+                 for _ in range(4)]
+        for play in self.plays:
+            kind = play.is_soft * 2 + play.is_pair
+            cell = table[kind][play.player_total]
+            if cell[play.dealer_upcard] is None:
+                cell[play.dealer_upcard] = play
+        self._deviation_table = tuple(tuple(tuple(row) for row in rows)
+                                      for rows in table)
+        # Triggers in the same layout (None = no deviation), so the common
+        # no-deviation case never touches an IndexPlay
+        self._trigger_table = tuple(
+            tuple(tuple(None if play is None else _trigger(play.true_count_threshold)
+                        for play in row)
+                  for row in rows)
+            for rows in self._deviation_table
+        )
     
     def get_applicable_plays(self, hand: Hand, dealer_upcard_value: int, 
                            true_count: float) -> List[IndexPlay]:
         """Get all index plays that apply to the current situation."""
-        applicable = []
-        for play in self.plays:
-            if play.applies(hand, dealer_upcard_value, true_count):
-                applicable.append(play)
-        return applicable
+        play = self.get_first_applicable(hand, dealer_upcard_value, true_count)
+        return [play] if play else []
+    
+    def get_first_applicable(self, hand: Hand, dealer_upcard_value: int,
+                             true_count: float) -> Optional[IndexPlay]:
+        """Get the index play that applies to the current situation, if any.
+        
+        Each (total, upcard, soft, pair) situation has at most one play, so
+        this is the only entry get_applicable_plays could return.
+        """
+        sig = hand.sig
+        total = sig & SIG_TOTAL_MASK
+        if total >= TABLE_TOTALS:
+            return None
+        
+        kind = (sig >> SIG_KIND_SHIFT) & 3
+        trigger = self._trigger_table[kind][total][dealer_upcard_value]
+        if trigger is None:
+            return None
+        sign, bound = trigger
+        if sign * true_count < bound:
+            return None
+        return self._deviation_table[kind][total][dealer_upcard_value]
     
     def get_index_action(self, hand: Hand, dealer_upcard_value: int, 
                         true_count: float, basic_action: Action) -> tuple[Action, Optional[IndexPlay]]:
@@ -412,14 +433,10 @@ class IndexPlays:
         Returns:
             Tuple of (action, applicable_index_play)
         """
-        applicable_plays = self.get_applicable_plays(hand, dealer_upcard_value, true_count)
-        
-        if applicable_plays:
-            # Use the first applicable play (they should be mutually exclusive)
-            play = applicable_plays[0]
-            return play.get_action(true_count), play
-        
-        return basic_action, None
+        play = self.get_first_applicable(hand, dealer_upcard_value, true_count)
+        if play is None:
+            return basic_action, None
+        return play.index_action, play
     
     def should_take_insurance(self, true_count: float) -> bool:
         """Check if insurance should be taken based on true count."""
@@ -430,4 +447,10 @@ class IndexPlays:
         if true_count >= self.insurance_threshold:
             return f"Take insurance (TC {true_count:+.1f} ≥ +3.0)"
         else:
-            return f"Skip insurance (TC {true_count:+.1f} < +3.0)"
\ No newline at end of file
+            return f"Skip insurance (TC {true_count:+.1f} < +3.0)"
+
+
+@lru_cache(maxsize=None)
+def get_index_plays() -> IndexPlays:
+    """Shared IndexPlays instance; the index plays are built once per process."""
+    return IndexPlays()
@@ -2,24 +2,38 @@
 V1 BlackJack Game Tracker.
 """
 import sys
-from typing import NoReturn, List, Optional
-from ..core import Table, DEFAULT_RULES, Card
+from collections import deque
+from dataclasses import dataclass
+from typing import NoReturn, List, Optional, Tuple
+from ..core import Table, Seat, DEFAULT_RULES, Card, RANK_SYMBOLS
 from ..strategy import Advisor
 
+# Section separator line for round and results output
+SEP = '=' * 60
 
-class BlackjackTableSimulator:
-    """Simple BlackJack Game Tracker."""
-    
-    def __init__(self):
-        self.table = None
-        self.advisor = None
-        self.players = []
-        self.user_position = None
-        self.action_history = []  # Stack of actions for undo functionality
-    
-    def welcome_message(self) -> str:
-        """Show enhanced welcome message."""
-        return """
+# Card input parsing: suit letters to drop, and commands that aren't cards
+_SUIT_STRIP = str.maketrans('', '', 'HSDC')
+_INVALID_INPUTS = frozenset(('STATUS', 'HELP', 'QUIT', 'EXIT', 'UNDO'))
+
+# Player decisions, canonicalized to one letter ('split' is 'p', not 's'),
+# and yes/no responses
+_ACTION_KEYS = {
+    'h': 'h', 'hit': 'h',
+    's': 's', 'stand': 's',
+    'd': 'd', 'double': 'd',
+    'p': 'p', 'split': 'p',
+    'a': 'a', 'advise': 'a',
+}
+_YES = frozenset(('y', 'yes'))
+_NO = frozenset(('n', 'no'))
+
+# Replies for commands run before the table is set up
+_NO_TABLE = "No table set up"
+_NO_SEAT = "No user seat set up"
+_NO_UPCARD = "No dealer upcard yet - start a round with 'newround'"
+
+# Built once; welcome_message is shown at startup and on 'help'
+_WELCOME_MESSAGE = """
 ╔══════════════════════════════════════════════════════════════╗
 ║                  🎰 LIVE BLACKJACK TRACKER 🎰                 ║
 ╠══════════════════════════════════════════════════════════════╣
@@ -52,7 +66,90 @@ class BlackjackTableSimulator:
 ║  ✓ Complete round management                                 ║
 ║  ✓ Real-time count tracking                                  ║
 ╚══════════════════════════════════════════════════════════════╝
-        """.strip()
+""".strip()
+
+
+# Advise-box labels, indexed by hand total (capped at 21) and upcard value
+_HAND_STRENGTH = ("Weak",) * 12 + ("Moderate",) * 5 + ("Strong",) * 5
+_DEALER_RISK = ("Medium",) * 2 + ("High (Bust Card)",) * 5 + ("Low (Pat Card)",) * 5
+# Win estimate by [upcard is a bust card][total]
+_WIN_PROB = (
+    ("Low",) * 12 + ("Medium",) * 10,
+    ("Low",) * 12 + ("Medium",) * 5 + ("High",) * 5,
+)
+# Count favor by (TC > +1) - (TC < -1), so -1 picks the last entry
+_COUNT_FAVOR = ("Neutral", "Player (+EV)", "House (-EV)")
+
+# Box for the advise command, filled in by get_advice
+_ADVICE_TEMPLATE = """
+╔══════════════════════════════════════════════════════════════╗
+║                    💡 STRATEGY ANALYSIS 💡                    ║
+╠══════════════════════════════════════════════════════════════╣
+║ Your Hand: {hand_str:<47}                                    ║
+║ Dealer Up: {dealer_str:<47}                                  ║
+╠══════════════════════════════════════════════════════════════╣
+║                     📊 COUNT METRICS                          ║
+╠══════════════════════════════════════════════════════════════╣
+║ Running Count: {running_count:+3d}             ║
+║ True Count:    {true_count:+5.1f}              ║
+║ Decks Left:    {decks_remaining:5.1f}          ║
+║ Penetration:   {penetration:5.1f}%             ║
+╠══════════════════════════════════════════════════════════════╣
+║                   🎯 DECISION BREAKDOWN                       ║
+╠══════════════════════════════════════════════════════════════╣
+║ Basic Strategy: {basic_action:<42}                           ║
+║ Index Plays:    {index_info:<42}                             ║
+║                                                              ║
+║ >>> RECOMMENDATION: {final_action:<37} <<<                   ║
+║                                                              ║
+║ Reasoning: {reasoning:<48}                         ║
+╠══════════════════════════════════════════════════════════════╣
+║                   📈 MATHEMATICAL ANALYSIS                    ║
+╠══════════════════════════════════════════════════════════════╣
+║ Hand Strength: {hand_strength:<47}                           ║
+║ Dealer Risk:   {dealer_risk:<47}                             ║
+║ Count Favor:   {count_favor:<47}                             ║
+║ Win Prob Est:  {win_prob:<47} ║
+╠══════════════════════════════════════════════════════════════╣
+║                     🔢 COMPUTATION LOGIC                      ║
+╠══════════════════════════════════════════════════════════════╣
+║ 1. Hand Type: {hand_type:<48} ║
+║ 2. Basic Strategy Table Lookup: {lookup_key} vs {dealer_value:<20} ║
+║ 3. Index Play Check: TC {true_count:+.1f} vs thresholds     ║
+║ 4. Final Decision: {final_action} (Basic Strategy)               ║
+╚══════════════════════════════════════════════════════════════╝"""
+
+@dataclass(slots=True)
+class _HistoryEntry:
+    """One undoable action: what happened, to which seat, with which card(s)."""
+    type: str
+    player: Optional[str] = None
+    card: Optional[Card] = None
+    # (hand index, card) for each card dealt to a seat's split hands
+    pairs: Optional[List[Tuple[int, Card]]] = None
+
+
+class BlackjackTableSimulator:
+    """Simple BlackJack Game Tracker."""
+    
+    def __init__(self):
+        self.table = None
+        self.advisor = None
+        self.players = []
+        self.user_position = None
+        # Per-seat "you" markers, built once by setup_players
+        self._seat_markers: List[str] = []
+        self._short_markers: List[str] = []
+        # (index, name, seat, marker) in seating order, built by setup_players
+        self._seat_list: List[Tuple[int, str, Seat, str]] = []
+        # Round output waiting to be written before the next prompt
+        self._out: List[str] = []
+        # Stack of actions for undo; the oldest entries drop off past 50
+        self.action_history: deque[_HistoryEntry] = deque(maxlen=50)
+    
+    def welcome_message(self) -> str:
+        """Show enhanced welcome message."""
+        return _WELCOME_MESSAGE
     
     def setup_players(self, names_str: str) -> str:
         """Set up players."""
@@ -60,55 +157,66 @@ class BlackjackTableSimulator:
             return "Usage: setup <player names with * for you>"
         
         names = names_str.split()
-        self.players = []
-        self.user_position = None
+        players = []
+        user_position = None
         
         for i, name in enumerate(names):
             if name.endswith('*'):
                 name = name[:-1]
-                self.user_position = i + 1
-            self.players.append(name)
+                user_position = i + 1
+            players.append(name)
         
-        if self.user_position is None:
+        if user_position is None:
             return "Mark yourself with * (e.g., 'setup Alice Me* Charlie')"
         
-        # Initialize table
-        self.table = Table(DEFAULT_RULES)
-        self.advisor = Advisor()
-        
-        # Add seats
-        for i, name in enumerate(self.players):
-            is_user = (i + 1 == self.user_position)
-            self.table.add_seat(name, is_user)
+        # Build the new table in locals; the current setup is only replaced
+        # once every seat has been added
+        table = Table(DEFAULT_RULES)
+        for i, name in enumerate(players):
+            is_user = (i + 1 == user_position)
+            table.add_seat(name, is_user)
         
-        # Show setup
-        result = f"\n{'='*60}\n"
-        result += f"🎰 BLACKJACK TABLE SETUP COMPLETE\n"
-        result += f"{'='*60}\n\n"
-        result += f"📍 SEATING ORDER:\n\n"
+        seat_markers = [" ⭐ (YOU)" if i + 1 == user_position else ""
+                        for i in range(len(players))]
+        short_markers = [" ← YOU" if i + 1 == user_position else ""
+                         for i in range(len(players))]
+        seats = table.seats
         
-        for i, name in enumerate(self.players):
-            marker = " ← YOU" if i + 1 == self.user_position else ""
-            result += f"   Seat {i+1}: {name}{marker}\n"
+        self.table = table
+        self.advisor = Advisor()
+        self.players = players
+        self.user_position = user_position
+        self._seat_markers = seat_markers
+        self._short_markers = short_markers
+        self._seat_list = [(i, name, seats[name], seat_markers[i])
+                           for i, name in enumerate(players)]
         
-        result += f"\n   🏛️  DEALER: House\n\n"
-        result += f"{'='*60}\n"
-        result += f"Ready! Type 'newround' to start.\n"
-        result += f"{'='*60}"
+        # Show setup
+        seating = "".join(
+            f"   Seat {i+1}: {name}{self._short_markers[i]}\n"
+            for i, name in enumerate(self.players)
+        )
+        result = (
+            f"\n{SEP}\n"
+            f"🎰 BLACKJACK TABLE SETUP COMPLETE\n"
+            f"{SEP}\n\n"
+            f"📍 SEATING ORDER:\n\n"
+            f"{seating}"
+            f"\n   🏛️  DEALER: House\n\n"
+            f"{SEP}\n"
+            f"Ready! Type 'newround' to start.\n"
+            f"{SEP}"
+        )
         
         return result
     
-    def _record_action(self, action_type: str, **kwargs):
+    def _record_action(self, action_type: str, player: Optional[str] = None,
+                       card: Optional[Card] = None,
+                       pairs: Optional[List[Tuple[int, Card]]] = None) -> _HistoryEntry:
         """Record an action for undo functionality."""
-        action = {
-            'type': action_type,
-            'data': kwargs.copy()
-        }
-        self.action_history.append(action)
-        
-        # Limit history size to prevent memory issues
-        if len(self.action_history) > 50:
-            self.action_history.pop(0)
+        entry = _HistoryEntry(action_type, player, card, pairs)
+        self.action_history.append(entry)
+        return entry
     
     def undo_last_action(self) -> str:
         """Undo the last recorded action."""
@@ -119,22 +227,13 @@ class BlackjackTableSimulator:
             return "❌ No active table"
             
         action = self.action_history.pop()
-        action_type = action['type']
-        data = action['data']
+        
+        handler = self._UNDO_DISPATCH.get(action.type)
+        if handler is None:
+            return f"❌ Cannot undo action type: {action.type}"
         
         try:
-            if action_type == 'player_card':
-                return self._undo_player_card(data['player'], data['card'])
-            elif action_type == 'dealer_upcard':
-                return self._undo_dealer_upcard(data['card'])
-            elif action_type == 'dealer_hole_card':
-                return self._undo_dealer_hole_card(data['card'])
-            elif action_type == 'dealer_hit':
-                return self._undo_dealer_hit(data['card'])
-            elif action_type == 'round_start':
-                return self._undo_round_start()
-            else:
-                return f"❌ Cannot undo action type: {action_type}"
+            return handler(self, action)
                 
         except Exception as e:
             # If undo fails, put action back
@@ -147,60 +246,77 @@ class BlackjackTableSimulator:
             return f"❌ Player {player} not found"
             
         seat = self.table.seats[player]
-        hand = seat.hands
         
-        if not hand.cards or hand.cards[-1] != card:
+        # The card may be the last one on any of the seat's split hands.
+        # Cards are interned per rank, so identity is enough.
+        for hand in reversed(seat.all_hands):
+            if hand.cards and hand.cards[-1] is card:
+                break
+        else:
             return f"❌ Cannot undo: {card} not the last card for {player}"
             
         # Remove card from hand
-        hand.cards.pop()
+        hand.pop_card()
         
         # Remove from shoe tracking and update count
-        if card in self.table.shoe.cards_dealt:
-            self.table.shoe.cards_dealt.remove(card)
-            self.table.shoe.running_count -= card.hi_lo_value
+        self.table.shoe.undeal_card(card)
             
         return f"✅ Undone: Removed {card} from {player} (RC: {self.table.shoe.running_count:+d})"
     
+    def _undo_split_cards(self, player: str, pairs: List[Tuple[int, Card]]) -> str:
+        """Undo the cards dealt to a player's split hands."""
+        if player not in self.table.seats:
+            return f"❌ Player {player} not found"
+        
+        hands = self.table.seats[player].all_hands
+        
+        # Check every card is still last on its hand before removing any
+        for index, card in pairs:
+            hand = hands[index]
+            if not hand.cards or hand.cards[-1] is not card:
+                return f"❌ Cannot undo: {card} not the last card for {player} Hand {index + 1}"
+        
+        shoe = self.table.shoe
+        for index, card in reversed(pairs):
+            hands[index].pop_card()
+            shoe.undeal_card(card)
+        
+        cards = ", ".join(str(card) for _, card in pairs)
+        return f"✅ Undone: Removed split cards {cards} from {player} (RC: {shoe.running_count:+d})"
+    
     def _undo_dealer_upcard(self, card: Card) -> str:
         """Undo dealer upcard."""
-        if self.table.dealer.upcard != card:
+        if self.table.dealer.upcard is not card:
             return f"❌ Cannot undo: {card} is not the dealer upcard"
             
-        self.table.dealer.upcard = None
+        self.table.dealer.clear_upcard()
         
         # Remove from shoe tracking
-        if card in self.table.shoe.cards_dealt:
-            self.table.shoe.cards_dealt.remove(card)
-            self.table.shoe.running_count -= card.hi_lo_value
+        self.table.shoe.undeal_card(card)
             
         return f"✅ Undone: Removed dealer upcard {card} (RC: {self.table.shoe.running_count:+d})"
     
     def _undo_dealer_hole_card(self, card: Card) -> str:
         """Undo dealer hole card."""
-        if self.table.dealer.hole_card != card:
+        if self.table.dealer.hole_card is not card:
             return f"❌ Cannot undo: {card} is not the dealer hole card"
             
-        self.table.dealer.hole_card = None
+        self.table.dealer.clear_hole_card()
         
         # Remove from shoe tracking  
-        if card in self.table.shoe.cards_dealt:
-            self.table.shoe.cards_dealt.remove(card)
-            self.table.shoe.running_count -= card.hi_lo_value
+        self.table.shoe.undeal_card(card)
             
         return f"✅ Undone: Removed dealer hole card {card} (RC: {self.table.shoe.running_count:+d})"
     
     def _undo_dealer_hit(self, card: Card) -> str:
         """Undo dealer hit card."""
-        if not self.table.dealer.hit_cards or self.table.dealer.hit_cards[-1] != card:
+        if not self.table.dealer.hit_cards or self.table.dealer.hit_cards[-1] is not card:
             return f"❌ Cannot undo: {card} not the last dealer hit card"
             
-        self.table.dealer.hit_cards.pop()
+        self.table.dealer.pop_hit_card()
         
         # Remove from shoe tracking
-        if card in self.table.shoe.cards_dealt:
-            self.table.shoe.cards_dealt.remove(card)
-            self.table.shoe.running_count -= card.hi_lo_value
+        self.table.shoe.undeal_card(card)
             
         return f"✅ Undone: Removed dealer hit {card} (RC: {self.table.shoe.running_count:+d})"
     
@@ -210,6 +326,16 @@ class BlackjackTableSimulator:
             self.table.end_round()
             return "✅ Undone: Round ended"
         return "❌ No active round to undo"
+    
+    # Undo handler for each recorded action type
+    _UNDO_DISPATCH = {
+        'player_card': lambda self, action: self._undo_player_card(action.player, action.card),
+        'player_split_cards': lambda self, action: self._undo_split_cards(action.player, action.pairs),
+        'dealer_upcard': lambda self, action: self._undo_dealer_upcard(action.card),
+        'dealer_hole_card': lambda self, action: self._undo_dealer_hole_card(action.card),
+        'dealer_hit': lambda self, action: self._undo_dealer_hit(action.card),
+        'round_start': lambda self, action: self._undo_round_start(),
+    }
 
     def start_new_round(self) -> str:
         """Start new round (EXACT REAL CASINO FLOW)."""
@@ -220,41 +346,40 @@ class BlackjackTableSimulator:
             self.table.start_round()
             self._record_action('round_start')
             
-            print(f"\n{'='*60}")
-            print(f"🎴 NEW ROUND - REAL CASINO DEALING SEQUENCE")
-            print(f"{'='*60}")
+            self._emit(f"\n{SEP}")
+            self._emit(f"🎴 NEW ROUND - REAL CASINO DEALING SEQUENCE")
+            self._emit(f"{SEP}")
             
             # ROUND 1: First card to each player, then dealer upcard
-            print(f"\n🔄 ROUND 1: First card around the table...")
-            for i, name in enumerate(self.players):
-                marker = " ⭐ (YOU)" if i + 1 == self.user_position else ""
+            self._emit(f"\n🔄 ROUND 1: First card around the table...")
+            seat_list = self._seat_list
+            for i, name, seat, marker in seat_list:
                 card1 = self._get_card_input(f"  {name}{marker} - Card 1: ")
-                self.table.add_card_to_player(name, card1)
+                self.table.add_card_to_player_fast(i, card1)
                 self._record_action('player_card', player=name, card=card1)
-                print(f"    ✓ {name}: {card1}")
+                self._emit(f"    ✓ {name}: {card1}")
             
             # Dealer upcard
             dealer_upcard = self._get_card_input(f"  🏛️  Dealer Upcard: ")
-            self.table.add_dealer_upcard(dealer_upcard)
+            self.table.add_dealer_upcard_fast(dealer_upcard)
             self._record_action('dealer_upcard', card=dealer_upcard)
-            print(f"    ✓ Dealer shows: {dealer_upcard}")
+            self._emit(f"    ✓ Dealer shows: {dealer_upcard}")
             
             # ROUND 2: Second card to each player, then dealer hole card
-            print(f"\n🔄 ROUND 2: Second card around the table...")
-            for i, name in enumerate(self.players):
-                marker = " ⭐ (YOU)" if i + 1 == self.user_position else ""
+            self._emit(f"\n🔄 ROUND 2: Second card around the table...")
+            for i, name, seat, marker in seat_list:
                 card2 = self._get_card_input(f"  {name}{marker} - Card 2: ")
-                self.table.add_card_to_player(name, card2)
+                self.table.add_card_to_player_fast(i, card2)
                 self._record_action('player_card', player=name, card=card2)
                 
-                hand = self.table.seats[name].hands
-                print(f"    ✓ {name}: {hand}")
+                hand = seat.primary_hand
+                self._emit(f"    ✓ {name}: {hand}")
             
             # Dealer hole card (dealt but hidden)
             dealer_hole = self._get_card_input(f"  🏛️  Dealer Hole Card (hidden): ")
-            self.table.add_dealer_hole_card(dealer_hole)
+            self.table.add_dealer_hole_card_fast(dealer_hole)
             self._record_action('dealer_holecard', card=dealer_hole)
-            print(f"    ✓ Dealer: {dealer_upcard} [hole card dealt but hidden]")
+            self._emit(f"    ✓ Dealer: {dealer_upcard} [hole card dealt but hidden]")
             
             # INSURANCE CHECK (when dealer shows Ace)
             if dealer_upcard.rank == 'A':
@@ -264,29 +389,29 @@ class BlackjackTableSimulator:
             # BLACKJACK CHECK (when dealer shows 10-value or Ace)
             if dealer_upcard.value == 10 or dealer_upcard.rank == 'A':
                 if self.table.dealer.hand.is_blackjack():
-                    print(f"\n🚨 DEALER BLACKJACK! {self.table.dealer.hand}")
-                    print("Round ends immediately - no player decisions needed.")
+                    self._emit(f"\n🚨 DEALER BLACKJACK! {self.table.dealer.hand}")
+                    self._emit("Round ends immediately - no player decisions needed.")
                     self._show_results()
                     return ""
             
             # Show table state for decision making
-            print(f"\n{'='*60}")
-            print(f"🎯 READY FOR PLAYER DECISIONS")
-            print(f"{'='*60}")
+            self._emit(f"\n{SEP}")
+            self._emit(f"🎯 READY FOR PLAYER DECISIONS")
+            self._emit(f"{SEP}")
             self._show_table()
             
             # Player decisions
-            print(f"\n{'='*60}")
-            print(f"🎯 PLAYER DECISIONS")
-            print(f"{'='*60}")
+            self._emit(f"\n{SEP}")
+            self._emit(f"🎯 PLAYER DECISIONS")
+            self._emit(f"{SEP}")
             
-            for i, name in enumerate(self.players):
+            for i, name, seat, marker in seat_list:
                 self._handle_player(name, i + 1)
             
             # Dealer turn
-            print(f"\n{'='*60}")
-            print(f"🏛️  DEALERS TURN") 
-            print(f"{'='*60}")
+            self._emit(f"\n{SEP}")
+            self._emit(f"🏛️  DEALERS TURN") 
+            self._emit(f"{SEP}")
             
             self._handle_dealer()
             
@@ -298,17 +423,41 @@ class BlackjackTableSimulator:
         except Exception as e:
             return f"Error: {e}"
     
+    def _emit(self, text: str = "") -> None:
+        """Queue a line of round output (written in one go before input)."""
+        self._out.append(f"{text}\n")
+    
+    def _flush_output(self) -> None:
+        """Write any queued round output to stdout."""
+        if self._out:
+            sys.stdout.write("".join(self._out))
+            self._out.clear()
+    
+    def _input(self, prompt: str) -> str:
+        """Write queued output and the prompt, then read one line of input.
+        
+        Reads straight from stdin rather than through input(); raises
+        EOFError when stdin is exhausted, like input() does.
+        """
+        self._out.append(prompt)
+        self._flush_output()
+        sys.stdout.flush()
+        line = sys.stdin.readline()
+        if not line:
+            raise EOFError
+        return line.rstrip('\n')
+    
     def _parse_card(self, card_str: str) -> Card:
         """Parse card from string."""
         # Remove whitespace and convert to uppercase
         card_str = card_str.strip().upper()
         
         # Handle common non-card inputs
-        if card_str in ['STATUS', 'HELP', 'QUIT', 'EXIT', 'UNDO']:
+        if card_str in _INVALID_INPUTS:
             raise ValueError(f"'{card_str}' is not a valid card")
         
         # Remove suit characters (H, S, D, C) but preserve rank
-        rank_str = ''.join(c for c in card_str if c not in 'HSDC')
+        rank_str = card_str.translate(_SUIT_STRIP)
         if not rank_str:
             rank_str = card_str[0] if card_str else ''
             
@@ -318,41 +467,42 @@ class BlackjackTableSimulator:
         """Get card input with special command handling."""
         while True:
             try:
-                user_input = input(prompt).strip().upper()
+                user_input = self._input(prompt).strip().upper()
                 
                 # Handle special commands during card input
                 if user_input == 'UNDO':
                     result = self.undo_last_action()
-                    print(f"    {result}")
+                    self._emit(f"    {result}")
                     continue
                 elif user_input in ['STATUS', 'HELP']:
-                    print(f"    Use '{user_input.lower()}' command outside of card input.")
+                    self._emit(f"    Use '{user_input.lower()}' command outside of card input.")
                     continue
                 elif user_input in ['QUIT', 'EXIT']:
-                    print("    Use 'quit' command to exit the tracker.")
+                    self._emit("    Use 'quit' command to exit the tracker.")
                     continue
                 
                 return self._parse_card(user_input)
                 
             except EOFError:
                 # Handle EOF gracefully (when no input is available)
-                print("\n    No input available. Exiting...")
+                self._emit("\n    No input available. Exiting...")
+                self._flush_output()
                 raise SystemExit(0)
             except ValueError as e:
-                print(f"    Error: {e}. Try again.")
+                self._emit(f"    Error: {e}. Try again.")
             except Exception as e:
-                print(f"    Invalid input: {e}. Try again.")
+                self._emit(f"    Invalid input: {e}. Try again.")
     
     def _get_action_input(self, prompt: str, player_name: str, position: int) -> str:
         """Get action input with undo support."""
         while True:
             try:
-                action = input(f"{prompt}: ").strip().lower()
+                action = self._input(f"{prompt}: ").strip().lower()
                 
                 # Handle undo special case
                 if action == 'undo':
                     result = self.undo_last_action()
-                    print(f"    {result}")
+                    self._emit(f"    {result}")
                     
                     # Check if undo changed the game state significantly
                     if "Round restarted" in result or "No actions" in result:
@@ -361,18 +511,20 @@ class BlackjackTableSimulator:
                         # Signal that we need to restart player decisions
                         return 'UNDO_RESTART'
                         
-                # Valid actions
-                if action in ['h', 'hit', 's', 'stand', 'd', 'double', 'p', 'split', 'a', 'advise']:
-                    return action
+                # Valid actions, returned as their single-letter key
+                key = _ACTION_KEYS.get(action)
+                if key is not None:
+                    return key
                     
-                print("Invalid choice. Use: h(it), s(tand), d(ouble), a(dvise)")
+                self._emit("Invalid choice. Use: h(it), s(tand), d(ouble), a(dvise)")
                 
             except EOFError:
                 # Handle EOF gracefully
-                print("\n    No input available. Exiting...")
+                self._emit("\n    No input available. Exiting...")
+                self._flush_output()
                 raise SystemExit(0)
             except Exception as e:
-                print(f"    Input error: {e}. Try again.")
+                self._emit(f"    Input error: {e}. Try again.")
     
     def _should_return_to_decision(self, player_name: str) -> bool:
         """Check if after undo we should return to this player's decision."""
@@ -380,7 +532,7 @@ class BlackjackTableSimulator:
             seat = self.table.seats[player_name]
             hand = seat.primary_hand
             # Player should decide if they have cards and aren't busted/21
-            return (len(hand.cards) > 0 and 
+            return (hand.num_cards > 0 and 
                    not hand.is_busted and 
                    not hand.is_blackjack and 
                    hand.total < 21)
@@ -388,67 +540,68 @@ class BlackjackTableSimulator:
     
     def _show_table(self) -> None:
         """Show table state."""
-        print(f"\n{'='*60}")
-        print(f"🎰 TABLE STATE")
-        print(f"{'='*60}")
+        self._emit(f"\n{SEP}")
+        self._emit(f"🎰 TABLE STATE")
+        self._emit(f"{SEP}")
+        
+        table = self.table
+        seat_list = self._seat_list
+        
+        # Read each hand once for both the display and the blackjack check
+        hands = [seat.primary_hand for _, _, seat, _ in seat_list]
         
-        for i, name in enumerate(self.players):
-            seat = self.table.seats[name]
-            hand = seat.hands
-            marker = " ← YOU" if i + 1 == self.user_position else ""
-            print(f"   {name}{marker}: {hand}")
+        for (_, name, _, _), marker, hand in zip(seat_list, self._short_markers, hands):
+            self._emit(f"   {name}{marker}: {hand}")
         
-        dealer = self.table.dealer
+        dealer = table.dealer
         if hasattr(dealer, 'hand') and len(dealer.all_cards) >= 2:
-            print(f"   DEALER: {dealer.hand}")
+            self._emit(f"   DEALER: {dealer.hand}")
         elif dealer.upcard:
-            print(f"   DEALER: {dealer.upcard} [?]")
+            self._emit(f"   DEALER: {dealer.upcard} [?]")
         
-        count = self.table.shoe.running_count
-        true_count = self.table.shoe.true_count
-        print(f"\n💎 COUNT: RC {count:+d} | TC {true_count:+.1f}")
+        shoe = table.shoe
+        self._emit(f"\n💎 COUNT: RC {shoe.running_count:+d} | TC {shoe.true_count:+.1f}")
         
         # Check for blackjacks
-        blackjacks = []
-        for name in self.players:
-            hand = self.table.seats[name].hands
-            if hand.is_blackjack:
-                blackjacks.append(name)
-        
-        if blackjacks:
-            print(f"\n🎉 BLACKJACK: {', '.join(blackjacks)}")
+        if any(hand.is_blackjack for hand in hands):
+            blackjacks = [name for (_, name, _, _), hand in zip(seat_list, hands)
+                          if hand.is_blackjack]
+            self._emit(f"\n🎉 BLACKJACK: {', '.join(blackjacks)}")
     
     def _handle_player(self, name: str, position: int) -> None:
         """Handle one player's complete turn."""
+        table = self.table
+        seat = table.seats[name]
+        shoe = table.shoe
         while True:
-            seat = self.table.seats[name]
-            hand = seat.hands
+            hand = seat.primary_hand
             
             # Check if done
             if hand.is_blackjack or hand.is_busted or hand.total >= 21:
                 if hand.is_blackjack:
-                    print(f"\n{name}: BLACKJACK - No action needed")
+                    self._emit(f"\n{name}: BLACKJACK - No action needed")
                 elif hand.is_busted:
-                    print(f"\n{name}: BUSTED - No action needed")
+                    self._emit(f"\n{name}: BUSTED - No action needed")
                 else:
-                    print(f"\n{name}: 21 - No action needed")
+                    self._emit(f"\n{name}: 21 - No action needed")
                 break
             
             marker = " (YOU)" if position == self.user_position else ""
-            print(f"\n{name}{marker}: {hand}")
+            self._emit(f"\n{name}{marker}: {hand}")
             
             # Show advice for user
             if position == self.user_position:
                 try:
                     # Get required parameters for advice
-                    dealer_upcard_value = self.table.dealer.upcard.value if self.table.dealer.upcard else 10
-                    count_info = self.table.shoe.get_count_info()
-                    true_count = count_info['true_count']
+                    upcard = table.dealer.upcard
+                    dealer_upcard_value = upcard.value if upcard else 10
+                    count_info = shoe.get_count_info()
+                    true_count = count_info.true_count
                     
                     advice = self.advisor.get_advice(hand, dealer_upcard_value, true_count)
-                    print(f"💡 ADVICE: {advice['action'].value.upper()}")
+                    self._emit(f"💡 ADVICE: {advice.action.value.upper()}")
                 except Exception as e:
-                    print(f"💡 ADVICE: Error - {e}")
+                    self._emit(f"💡 ADVICE: Error - {e}")
             
             # Get decision with undo support
             can_split = hand.is_pair and not seat.has_splits
@@ -456,12 +609,12 @@ class BlackjackTableSimulator:
                 options = "(h)it, (s)tand, (d)ouble, (a)dvise"
                 if can_split:
                     options += ", (p)split"
-                print(f"Options: {options}")
+                self._emit(f"Options: {options}")
             else:
                 options = "(h)it, (s)tand, (d)ouble"
                 if can_split:
                     options += ", (p)split"  
-                print(f"Options: {options}")
+                self._emit(f"Options: {options}")
             
             decision = self._get_action_input(f"{name} action", name, position)
             
@@ -470,68 +623,75 @@ class BlackjackTableSimulator:
                 # An undo took us to an earlier state, restart player decisions
                 return
             
-            if decision in ['h', 'hit']:
+            if decision == 'h':
                 card = self._get_card_input(f"Card for {name}")
-                self.table.add_card_to_player(name, card)
+                table.add_card_to_player(name, card)
                 self._record_action('player_card', player=name, card=card)
-                new_hand = seat.hands
-                print(f"✓ {name}: {card} → {new_hand}")
+                new_hand = seat.primary_hand
+                self._emit(f"✓ {name}: {card} → {new_hand}")
                 
                 if new_hand.is_busted:
-                    print(f"🚨 {name} BUSTS!")
+                    self._emit(f"🚨 {name} BUSTS!")
                     break
                 elif new_hand.total == 21:
-                    print(f"🎯 {name} has 21!")
+                    self._emit(f"🎯 {name} has 21!")
                     break
             
-            elif decision in ['s', 'stand']:
-                print(f"✓ {name} stands on {hand}")
+            elif decision == 's':
+                self._emit(f"✓ {name} stands on {hand}")
                 break
             
-            elif decision in ['d', 'double'] and hand.can_double:
+            elif decision == 'd' and hand.can_double:
                 card = self._get_card_input(f"Double card for {name}")
-                self.table.add_card_to_player(name, card)
+                table.add_card_to_player(name, card)
                 self._record_action('player_card', player=name, card=card)
-                new_hand = seat.hands
-                print(f"✓ {name} doubles: {card} → {new_hand}")
+                new_hand = seat.primary_hand
+                self._emit(f"✓ {name} doubles: {card} → {new_hand}")
                 
                 if new_hand.is_busted:
-                    print(f"🚨 {name} BUSTS!")
+                    self._emit(f"🚨 {name} BUSTS!")
                 break
             
-            elif decision in ['p', 'split'] and can_split:
+            elif decision == 'p' and can_split:
                 # Split the hand
-                self.table.split_player_hand(name)
-                print(f"✓ {name} splits {hand.pair_rank.symbol},{hand.pair_rank.symbol}")
+                table.split_player_hand(name)
+                pair_symbol = RANK_SYMBOLS[hand.pair_rank]
+                self._emit(f"✓ {name} splits {pair_symbol},{pair_symbol}")
                 
-                # Handle each split hand
+                # Handle each split hand; all of the split's cards share
+                # one history entry so a single undo takes them back
                 split_hands = seat.all_hands
+                split_entry = None
+                history = self.action_history
                 for i, split_hand in enumerate(split_hands):
                     hand_num = i + 1
-                    print(f"\n{name} Hand {hand_num}: {split_hand}")
+                    self._emit(f"\n{name} Hand {hand_num}: {split_hand}")
                     
                     # Deal second card to each split hand
                     card = self._get_card_input(f"Card for {name} Hand {hand_num}")
-                    # Add card to specific split hand
-                    split_hand.add_card(card)
-                    self.table.shoe.deal_card(card)  # Update count
-                    self._record_action('player_card', player=name, card=card)
-                    print(f"✓ {name} Hand {hand_num}: {card} → {split_hand}")
+                    table.add_card_to_split(name, i, card)
+                    if split_entry is not None and history and history[-1] is split_entry:
+                        split_entry.pairs.append((i, card))
+                    else:
+                        # First card, or the entry was undone while prompting
+                        split_entry = self._record_action('player_split_cards', player=name,
+                                                          pairs=[(i, card)])
+                    self._emit(f"✓ {name} Hand {hand_num}: {card} → {split_hand}")
                     
                     # Special rule: Aces get one card only
-                    if split_hand.has_ace and len(split_hand.cards) == 2:
-                        print(f"✓ {name} Hand {hand_num}: Aces get one card only")
+                    if split_hand.has_ace and split_hand.num_cards == 2:
+                        self._emit(f"✓ {name} Hand {hand_num}: Aces get one card only")
                         continue
                         
                 # After splitting, continue with each hand's decisions
                 break
             
-            elif decision in ['a', 'advise']:
+            elif decision == 'a':
                 if position == self.user_position:
-                    print(self.get_advice())
+                    self._emit(self.get_advice())
                     continue
                 else:
-                    print(f"Advise option only available for you (marked position)")
+                    self._emit(f"Advise option only available for you (marked position)")
                     continue
             
             else:
@@ -539,284 +699,267 @@ class BlackjackTableSimulator:
                     valid_options = "h(it), s(tand), d(ouble), a(dvise)"
                     if can_split:
                         valid_options += ", p(split)"
-                    print(f"Invalid choice. Use: {valid_options}")
+                    self._emit(f"Invalid choice. Use: {valid_options}")
                 else:
                     valid_options = "h(it), s(tand), d(ouble)"
                     if can_split:
                         valid_options += ", p(split)"
-                    print(f"Invalid choice. Use: {valid_options}")
+                    self._emit(f"Invalid choice. Use: {valid_options}")
                 continue
         
         # Show count after each player
-        print(f"💎 Count: RC {self.table.shoe.running_count:+d} | TC {self.table.shoe.true_count:+.1f}")
+        self._emit(f"💎 Count: RC {shoe.running_count:+d} | TC {shoe.true_count:+.1f}")
     
     def _handle_dealer(self) -> None:
         """Handle dealer's complete turn."""
+        table = self.table
+        dealer = table.dealer
+        
         # Get hole card with retry
         while True:
             try:
                 hole_card = self._get_card_input(f"Dealer hole card: ")
-                self.table.add_dealer_hole_card(hole_card)
+                table.add_dealer_hole_card(hole_card)
                 self._record_action('dealer_hole_card', card=hole_card)
-                dealer_hand = self.table.dealer.hand
-                print(f"✓ Dealer reveals: {hole_card} → {dealer_hand}")
+                dealer_hand = dealer.hand
+                self._emit(f"✓ Dealer reveals: {hole_card} → {dealer_hand}")
                 break
             except Exception as e:
-                print(f"Error adding hole card: {e}. Try again.")
+                self._emit(f"Error adding hole card: {e}. Try again.")
                 continue
             
-        # Dealer hits to 17 with retry logic
-        while self.table.dealer.hand.total < 17:
-            dealer_hand = self.table.dealer.hand  # Refresh hand each iteration
+        # Dealer hits to 17 with retry logic; the hand object is replaced
+        # when a card is taken back, so it is only re-read after changes
+        dealer_hand = dealer.hand
+        while dealer_hand.total < 17:
             hit_card = self._get_card_input(f"Dealer hits (total {dealer_hand.total}): ")
-            self.table.add_dealer_hit_card(hit_card)
+            table.add_dealer_hit_card(hit_card)
             self._record_action('dealer_hit', card=hit_card)
-            dealer_hand = self.table.dealer.hand  # Refresh after hit
-            print(f"✓ Dealer: {hit_card} → {dealer_hand}")
+            dealer_hand = dealer.hand  # Refresh after hit
+            self._emit(f"✓ Dealer: {hit_card} → {dealer_hand}")
                     
             if dealer_hand.is_busted:
-                print(f"🚨 DEALER BUSTS!")
+                self._emit(f"🚨 DEALER BUSTS!")
                 break
         
         # Final dealer status
-        final_dealer_hand = self.table.dealer.hand
-        if not final_dealer_hand.is_busted and final_dealer_hand.total >= 17:
-            print(f"✓ Dealer stands on {final_dealer_hand.total}")
+        if not dealer_hand.is_busted and dealer_hand.total >= 17:
+            self._emit(f"✓ Dealer stands on {dealer_hand.total}")
     
     def _show_results(self) -> None:
         """Show final results."""
         dealer_hand = self.table.dealer.hand
         
-        print(f"\n{'='*60}")
-        print(f"🏁 FINAL RESULTS")
-        print(f"{'='*60}")
+        self._emit(f"\n{SEP}")
+        self._emit(f"🏁 FINAL RESULTS")
+        self._emit(f"{SEP}")
         
         # Show dealer result without duplicate status
         if dealer_hand.is_busted:
-            print(f"DEALER: {dealer_hand} - BUST")
+            self._emit(f"DEALER: {dealer_hand} - BUST")
         elif dealer_hand.is_blackjack:
-            print(f"DEALER: {dealer_hand} - Blackjack!")
+            self._emit(f"DEALER: {dealer_hand} - Blackjack!")
         else:
-            print(f"DEALER: {dealer_hand} - {dealer_hand.total}")
-        print(f"")
+            self._emit(f"DEALER: {dealer_hand} - {dealer_hand.total}")
+        self._emit(f"")
+        
+        # Dealer outcome is fixed for the round; read it once
+        dealer_bj = dealer_hand.is_blackjack
+        dealer_bust = dealer_hand.is_busted
+        dealer_total = dealer_hand.total
         
-        for name in self.players:
-            seat = self.table.seats[name]
-            hand = seat.hands
-            marker = " (YOU)" if name == self.table.user_seat_id else ""
+        table = self.table
+        user_seat_id = table.user_seat_id
+        for _, name, seat, _ in self._seat_list:
+            hand = seat.primary_hand
+            marker = " (YOU)" if name == user_seat_id else ""
             
-            if hand.is_blackjack and not dealer_hand.is_blackjack:
+            if hand.is_blackjack and not dealer_bj:
                 result = "BLACKJACK! 🎉"
             elif hand.is_busted:
                 result = "BUST 🚨"
-            elif dealer_hand.is_busted and not hand.is_busted:
+            elif dealer_bust:
                 result = "WIN! 🎯"
-            elif hand.total > dealer_hand.total and not hand.is_busted:
+            elif hand.total > dealer_total:
                 result = "WIN! 🎯"
-            elif hand.total == dealer_hand.total and not hand.is_busted and not dealer_hand.is_busted:
+            elif hand.total == dealer_total:
                 result = "PUSH 🤝"
             else:
                 result = "LOSE 😞"
             
-            print(f"{name}{marker}: {hand} - {result}")
+            self._emit(f"{name}{marker}: {hand} - {result}")
         
         # Final count
-        count = self.table.shoe.running_count
-        true_count = self.table.shoe.true_count
-        cards_dealt = len(self.table.shoe.cards_dealt)
-        penetration = (cards_dealt / (self.table.shoe.num_decks * 52)) * 100
+        shoe = table.shoe
+        count = shoe.running_count
+        true_count = shoe.true_count
+        cards_dealt = shoe.num_dealt
+        penetration = shoe.penetration * 100
         
-        print(f"\n💎 FINAL COUNT: RC {count:+d} | TC {true_count:+.1f}")
-        print(f"📊 Cards dealt: {cards_dealt} ({penetration:.1f}% penetration)")
+        self._emit(f"\n💎 FINAL COUNT: RC {count:+d} | TC {true_count:+.1f}")
+        self._emit(f"📊 Cards dealt: {cards_dealt} ({penetration:.1f}% penetration)")
         
         # Check if penetration suggests shuffle (like real casino)
-        if self.table.shoe.needs_shuffle:
-            print(f"⚠️  High penetration! Consider 'shuffle' command.")
+        if shoe.needs_shuffle:
+            self._emit(f"⚠️  High penetration! Consider 'shuffle' command.")
         
-        print(f"\n🎰 Round complete! Type 'newround' for next hand.")
+        self._emit(f"\n🎰 Round complete! Type 'newround' for next hand.")
         
         # End the round to allow next round
-        self.table.end_round()
+        table.end_round()
     
     def _handle_insurance(self) -> bool:
         """Handle insurance when dealer shows Ace. Returns True if round continues."""
-        print(f"\n🛡️  INSURANCE OPTION (Dealer shows Ace)")
-        print(f"{'='*60}")
+        self._emit(f"\n🛡️  INSURANCE OPTION (Dealer shows Ace)")
+        self._emit(f"{SEP}")
         
         # Get true count for insurance decision
         count_info = self.table.shoe.get_count_info()
-        true_count = count_info['true_count']
+        true_count = count_info.true_count
         
-        print(f"📊 True Count: {true_count:+.1f}")
-        print(f"💡 Insurance Strategy: Take insurance at True Count +3 or higher")
+        self._emit(f"📊 True Count: {true_count:+.1f}")
+        self._emit(f"💡 Insurance Strategy: Take insurance at True Count +3 or higher")
         
         # Ask user for insurance decision
         while True:
             try:
-                response = input(f"\nTake insurance? (y/n): ").strip().lower()
-                if response in ['y', 'yes']:
-                    print(f"✓ Insurance taken")
+                response = self._input(f"\nTake insurance? (y/n): ").strip().lower()
+                if response in _YES:
+                    self._emit(f"✓ Insurance taken")
                     break
-                elif response in ['n', 'no']:
-                    print(f"✓ No insurance")
+                elif response in _NO:
+                    self._emit(f"✓ No insurance")
                     break
                 else:
-                    print("Please enter 'y' or 'n'")
+                    self._emit("Please enter 'y' or 'n'")
             except (EOFError, KeyboardInterrupt):
-                print(f"\n✓ No insurance (default)")
+                self._emit(f"\n✓ No insurance (default)")
                 response = 'n'
                 break
         
         # Check for dealer blackjack
         if self.table.dealer.hand.is_blackjack():
-            print(f"\n🚨 DEALER HAS BLACKJACK!")
-            print(f"Dealer: {self.table.dealer.hand}")
+            self._emit(f"\n🚨 DEALER HAS BLACKJACK!")
+            self._emit(f"Dealer: {self.table.dealer.hand}")
             
-            if response in ['y', 'yes']:
-                print(f"🛡️  Insurance pays 2:1 - You break even!")
+            if response in _YES:
+                self._emit(f"🛡️  Insurance pays 2:1 - You break even!")
             else:
-                print(f"💸 No insurance - You lose main bet")
+                self._emit(f"💸 No insurance - You lose main bet")
             
             # Show player blackjacks vs dealer blackjack
-            for name in self.players:
-                hand = self.table.seats[name].hands
+            for _, name, seat, _ in self._seat_list:
+                hand = seat.primary_hand
                 if hand.is_blackjack:
-                    print(f"{name}: {hand} - PUSH (tie with dealer)")
+                    self._emit(f"{name}: {hand} - PUSH (tie with dealer)")
                 else:
-                    print(f"{name}: {hand} - LOSES to dealer blackjack")
+                    self._emit(f"{name}: {hand} - LOSES to dealer blackjack")
             
             return False  # Round ends
         else:
-            print(f"✓ Dealer does NOT have blackjack")
-            if response in ['y', 'yes']:
-                print(f"💸 Insurance bet loses")
+            self._emit(f"✓ Dealer does NOT have blackjack")
+            if response in _YES:
+                self._emit(f"💸 Insurance bet loses")
             return True  # Round continues
     
+    # Handler for each command, called with the text after the command word
+    _COMMANDS = {
+        'setup': lambda self, args: self.setup_players(args),
+        'newround': lambda self, args: (
+            self.start_new_round() if self.table is not None
+            else "Please run 'setup' first to configure players."),
+        'advise': lambda self, args: self.get_advice(),
+        'status': lambda self, args: self.get_status(),
+        'shuffle': lambda self, args: self.shuffle_shoe(),
+        'undo': lambda self, args: self.undo_last_action(),
+        'help': lambda self, args: self.welcome_message(),
+    }
+    _QUIT_COMMANDS = frozenset(('quit', 'q', 'exit'))
+    
     def process_command(self, line: str) -> bool:
         """Process commands with enhanced error handling."""
-        line = line.strip()
-        if not line:
+        parts = line.split(None, 1)
+        if not parts:
             return True
         
-        parts = line.split()
         command = parts[0].lower()
+        args = parts[1] if len(parts) > 1 else ''
         
         try:
-            if command == "setup":
-                result = self.setup_players(' '.join(parts[1:]))
-            elif command == "newround":
-                if self.table is None:
-                    result = "Please run 'setup' first to configure players."
-                else:
-                    result = self.start_new_round()
-            elif command == "advise":
-                result = self.get_advice()
-            elif command == "status":
-                result = self.get_status()
-            elif command == "shuffle":
-                result = self.shuffle_shoe()
-            elif command == "undo":
-                result = self.undo_last_action()
-            elif command in ["quit", "q", "exit"]:
+            if command in self._QUIT_COMMANDS:
                 return False
-            elif command == "help":
-                result = self.welcome_message()
+            
+            handler = self._COMMANDS.get(command)
+            if handler is not None:
+                result = handler(self, args)
             else:
                 result = f"❌ Unknown command: '{command}'. Type 'help' to see all commands."
             
             if result:
-                print(result)
+                self._emit(result)
                 
-        except Exception as e:
-            print(f"❌ Error: {e}")
+        except (ValueError, KeyError, AttributeError) as e:
+            self._emit(f"❌ Error: {e}")
         
+        # Round output and the result go out in one write
+        self._flush_output()
         return True
     
     def get_advice(self) -> str:
         """Get detailed strategy advice with complete breakdown."""
-        if not self.table or not self.table.user_seat_id:
-            return "No user seat set up"
-        
-        try:
-            user_seat = self.table.get_user_seat()
-            user_hand = user_seat.hands
-            dealer_upcard = self.table.dealer.upcard
-            
-            # Get count metrics
-            count_info = self.table.shoe.get_count_info()
-            
-            # Get advice with correct parameters
-            dealer_upcard_value = dealer_upcard.value if dealer_upcard else 10
-            true_count = count_info['true_count']
-            advice = self.advisor.get_advice(user_hand, dealer_upcard_value, true_count)
-            
-            # Format strings properly
-            hand_str = str(user_hand)
-            dealer_str = str(dealer_upcard)
-            basic_action = advice['basic_strategy'].value.upper()
-            final_action = advice['action'].value.upper()
-            index_info = advice['reasoning'] if advice['count_influenced'] else 'None applicable'
-            
+        table = self.table
+        if not table or not table.user_seat_id:
+            return _NO_SEAT
+        dealer_upcard = table.dealer.upcard
+        if dealer_upcard is None:
+            return _NO_UPCARD
+        
+        user_hand = table.get_user_seat().primary_hand
+        
+        # Get count metrics
+        count_info = table.shoe.get_count_info()
+        
+        # Get advice with correct parameters
+        upcard_value = dealer_upcard.value
+        true_count = count_info.true_count
+        advice = self.advisor.get_advice(user_hand, upcard_value, true_count)
+        
+        total = min(user_hand.total, 21)
+        # Shown twice in the box when the count changed the play
+        reasoning = advice.reasoning
+        fields = {
+            'hand_str': str(user_hand),
+            'dealer_str': str(dealer_upcard),
+            'running_count': count_info.running_count,
+            'true_count': true_count,
+            'decks_remaining': count_info.decks_remaining,
+            'penetration': count_info.penetration,
+            'basic_action': advice.basic_strategy.value.upper(),
+            'index_info': reasoning if advice.count_influenced else 'None applicable',
+            'final_action': advice.action.value.upper(),
+            'reasoning': reasoning,
             # Hand analysis
-            hand_strength = 'Strong' if user_hand.total >= 17 else 'Moderate' if user_hand.total >= 12 else 'Weak'
-            dealer_risk = 'High (Bust Card)' if dealer_upcard.value >= 2 and dealer_upcard.value <= 6 else 'Low (Pat Card)' if dealer_upcard.value >= 7 else 'Medium'
-            count_favor = 'Player (+EV)' if count_info['true_count'] > 1 else 'House (-EV)' if count_info['true_count'] < -1 else 'Neutral'
-            
-            result = f"""
-╔══════════════════════════════════════════════════════════════╗
-║                    💡 STRATEGY ANALYSIS 💡                    ║
-╠══════════════════════════════════════════════════════════════╣
-║ Your Hand: {hand_str:<47}                                    ║
-║ Dealer Up: {dealer_str:<47}                                  ║
-╠══════════════════════════════════════════════════════════════╣
-║                     📊 COUNT METRICS                          ║
-╠══════════════════════════════════════════════════════════════╣
-║ Running Count: {count_info['running_count']:+3d}             ║
-║ True Count:    {count_info['true_count']:+5.1f}              ║
-║ Decks Left:    {count_info['decks_remaining']:5.1f}          ║
-║ Penetration:   {count_info['penetration']:5.1f}%             ║
-╠══════════════════════════════════════════════════════════════╣
-║                   🎯 DECISION BREAKDOWN                       ║
-╠══════════════════════════════════════════════════════════════╣
-║ Basic Strategy: {basic_action:<42}                           ║
-║ Index Plays:    {index_info:<42}                             ║
-║                                                              ║
-║ >>> RECOMMENDATION: {final_action:<37} <<<                   ║
-║                                                              ║
-║ Reasoning: {advice['reasoning']:<48}                         ║
-╠══════════════════════════════════════════════════════════════╣
-║                   📈 MATHEMATICAL ANALYSIS                    ║
-╠══════════════════════════════════════════════════════════════╣
-║ Hand Strength: {hand_strength:<47}                           ║
-║ Dealer Risk:   {dealer_risk:<47}                             ║
-║ Count Favor:   {count_favor:<47}                             ║
-║ Win Prob Est:  {'High' if user_hand.total >= 17 and dealer_upcard.value <= 6 else 'Medium' if user_hand.total >= 12 else 'Low':<47} ║
-╠══════════════════════════════════════════════════════════════╣
-║                     🔢 COMPUTATION LOGIC                      ║
-╠══════════════════════════════════════════════════════════════╣
-║ 1. Hand Type: {'Soft total' if user_hand.is_soft else 'Pair' if user_hand.is_pair else 'Hard total':<48} ║
-║ 2. Basic Strategy Table Lookup: {user_hand.total if not user_hand.is_pair else str(user_hand.pair_rank.symbol)} vs {dealer_upcard.value:<20} ║
-║ 3. Index Play Check: TC {count_info['true_count']:+.1f} vs thresholds     ║
-║ 4. Final Decision: {final_action} (Basic Strategy)               ║
-╚══════════════════════════════════════════════════════════════╝"""
-            return result
-        except Exception as e:
-            return f"Error getting advice: {e}"
+            'hand_strength': _HAND_STRENGTH[total],
+            'dealer_risk': _DEALER_RISK[upcard_value],
+            'count_favor': _COUNT_FAVOR[(true_count > 1) - (true_count < -1)],
+            'win_prob': _WIN_PROB[upcard_value <= 6][total],
+            'hand_type': 'Soft total' if user_hand.is_soft else 'Pair' if user_hand.is_pair else 'Hard total',
+            'lookup_key': user_hand.total if not user_hand.is_pair else RANK_SYMBOLS[user_hand.pair_rank],
+            'dealer_value': upcard_value,
+        }
+        return _ADVICE_TEMPLATE.format_map(fields)
     
     def get_status(self) -> str:
         """Get table status."""
         if not self.table:
-            return "No table set up"
+            return _NO_TABLE
         return self.table.get_status()
     
     def shuffle_shoe(self) -> str:
         """Reset shoe."""
         if not self.table:
-            return "No table set up"
-        self.table.shoe = self.table.shoe.__class__(
-            self.table.rules.num_decks, 
-            self.table.rules.penetration_threshold
-        )
+            return _NO_TABLE
+        self.table.shoe.shuffle()
         # Clear action history after shuffle
         self.action_history.clear()
         return "🔄 Shoe shuffled. Counts reset."
@@ -2,112 +2,85 @@
 Unit tests for basic strategy implementation.
 Verifies basic strategy matches published S17 charts.
 """
+import pickle
 import unittest
-from src.core import Hand, Card, Rank
-from src.strategy import BasicStrategy, Action
+from src.core import (Hand, Card, CARDS, Rank, Shoe, DealerHand, Seat, Table,
+                      SIG_PAIR, SIG_SOFT, SIG_PAIR_VALUE_SHIFT)
+from src.strategy import BasicStrategy, Action, Advisor, IndexPlays, DOUBLE, HIT, to_action
+
+
+# (cards, dealer upcard, expected action, can_double) per published S17 chart
+HARD_CASES = [
+    ((Rank.THREE, Rank.FIVE), 6, Action.HIT, True),     # Always hit low totals
+    ((Rank.TEN, Rank.SEVEN), 10, Action.STAND, True),   # Always stand on 17+
+    ((Rank.SIX, Rank.FIVE), 9, Action.DOUBLE, True),    # Double 11 vs most cards
+]
+SOFT_CASES = [
+    ((Rank.ACE, Rank.SEVEN), 9, Action.HIT, True),      # Soft 18 vs 9: Hit
+    ((Rank.ACE, Rank.EIGHT), 6, Action.STAND, True),    # Soft 19: Always stand
+    ((Rank.ACE, Rank.FIVE), 6, Action.DOUBLE, True),    # Soft 16 vs 6: Double
+]
+PAIR_CASES = [
+    ((Rank.ACE, Rank.ACE), 10, Action.SPLIT, True),     # Always split Aces
+    ((Rank.EIGHT, Rank.EIGHT), 10, Action.SPLIT, True), # Always split 8s
+    ((Rank.TEN, Rank.KING), 6, Action.STAND, True),     # Never split 10s
+    ((Rank.FIVE, Rank.FIVE), 6, Action.DOUBLE, True),   # Never split 5s (treat as 10)
+]
+NO_DOUBLE_CASES = [
+    ((Rank.SIX, Rank.FIVE), 9, Action.HIT, False),      # Hit instead of double
+    ((Rank.ACE, Rank.FIVE), 6, Action.HIT, False),      # Soft double becomes hit
+]
+SPECIFIC_CASES = [
+    ((Rank.TEN, Rank.TWO), 2, Action.HIT, True),        # 12 vs 2: Hit
+    ((Rank.TEN, Rank.TWO), 4, Action.STAND, True),      # 12 vs 4: Stand
+    ((Rank.TEN, Rank.SIX), 10, Action.HIT, True),       # 16 vs 10: Hit (basic strategy)
+    ((Rank.FIVE, Rank.FOUR), 2, Action.HIT, True),      # 9 vs 2: Hit (not double)
+    ((Rank.FIVE, Rank.FOUR), 3, Action.DOUBLE, True),   # 9 vs 3: Double
+]
 
 
 class TestBasicStrategy(unittest.TestCase):
     """Test cases for basic strategy implementation."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.strategy = BasicStrategy()
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixtures shared by every case."""
+        cls.strategy = BasicStrategy()
+    
+    def _check_cases(self, cases):
+        """Check each (cards, dealer, expected, can_double) row in a subtest."""
+        for ranks, dealer, expected, can_double in cases:
+            with self.subTest(cards=ranks, dealer=dealer, can_double=can_double):
+                hand = Hand([Card(rank) for rank in ranks])
+                action = self.strategy.get_action(hand, dealer, can_double=can_double)
+                self.assertEqual(action, expected)
     
     def test_hard_totals_basic_cases(self):
         """Test basic hard total cases."""
-        # Always hit low totals
-        hand = Hand([Card(Rank.THREE), Card(Rank.FIVE)])  # Hard 8
-        action = self.strategy.get_action(hand, 6)
-        self.assertEqual(action, Action.HIT)
-        
-        # Always stand on 17+
-        hand = Hand([Card(Rank.TEN), Card(Rank.SEVEN)])  # Hard 17
-        action = self.strategy.get_action(hand, 10)
-        self.assertEqual(action, Action.STAND)
-        
-        # Double 11 vs most cards
-        hand = Hand([Card(Rank.SIX), Card(Rank.FIVE)])  # Hard 11
-        action = self.strategy.get_action(hand, 9)
-        self.assertEqual(action, Action.DOUBLE)
+        self._check_cases(HARD_CASES)
     
     def test_soft_totals_basic_cases(self):
         """Test basic soft total cases."""
-        # Soft 18 vs 9: Hit
-        hand = Hand([Card(Rank.ACE), Card(Rank.SEVEN)])  # Soft 18
-        action = self.strategy.get_action(hand, 9)
-        self.assertEqual(action, Action.HIT)
-        
-        # Soft 19: Always stand
-        hand = Hand([Card(Rank.ACE), Card(Rank.EIGHT)])  # Soft 19
-        action = self.strategy.get_action(hand, 6)
-        self.assertEqual(action, Action.STAND)
-        
-        # Soft 16 vs 6: Double
-        hand = Hand([Card(Rank.ACE), Card(Rank.FIVE)])  # Soft 16
-        action = self.strategy.get_action(hand, 6)
-        self.assertEqual(action, Action.DOUBLE)
+        self._check_cases(SOFT_CASES)
     
     def test_pairs_basic_cases(self):
         """Test basic pair cases."""
-        # Always split Aces
-        hand = Hand([Card(Rank.ACE), Card(Rank.ACE)])
-        action = self.strategy.get_action(hand, 10)
-        self.assertEqual(action, Action.SPLIT)
-        
-        # Always split 8s
-        hand = Hand([Card(Rank.EIGHT), Card(Rank.EIGHT)])
-        action = self.strategy.get_action(hand, 10)
-        self.assertEqual(action, Action.SPLIT)
-        
-        # Never split 10s
-        hand = Hand([Card(Rank.TEN), Card(Rank.KING)])
-        action = self.strategy.get_action(hand, 6)
-        self.assertEqual(action, Action.STAND)
-        
-        # Never split 5s (treat as 10)
-        hand = Hand([Card(Rank.FIVE), Card(Rank.FIVE)])
-        action = self.strategy.get_action(hand, 6)
-        self.assertEqual(action, Action.DOUBLE)
+        self._check_cases(PAIR_CASES)
     
     def test_doubling_restrictions(self):
         """Test doubling when not allowed."""
-        # Should hit instead of double when can_double=False
+        self._check_cases(NO_DOUBLE_CASES)
+    
+    def test_action_codes(self):
+        """Test integer action codes agree with Action results."""
         hand = Hand([Card(Rank.SIX), Card(Rank.FIVE)])  # Hard 11
-        action = self.strategy.get_action(hand, 9, can_double=False)
-        self.assertEqual(action, Action.HIT)
-        
-        # Soft double should become hit
-        hand = Hand([Card(Rank.ACE), Card(Rank.FIVE)])  # Soft 16
-        action = self.strategy.get_action(hand, 6, can_double=False)
-        self.assertEqual(action, Action.HIT)
+        self.assertEqual(self.strategy.get_action_code(hand, 9), DOUBLE)
+        self.assertEqual(self.strategy.get_action_code(hand, 9, can_double=False), HIT)
+        self.assertIs(to_action(DOUBLE), Action.DOUBLE)
     
     def test_specific_strategy_points(self):
         """Test specific strategy decision points."""
-        # 12 vs 2: Hit
-        hand = Hand([Card(Rank.TEN), Card(Rank.TWO)])
-        action = self.strategy.get_action(hand, 2)
-        self.assertEqual(action, Action.HIT)
-        
-        # 12 vs 4: Stand
-        hand = Hand([Card(Rank.TEN), Card(Rank.TWO)])
-        action = self.strategy.get_action(hand, 4)
-        self.assertEqual(action, Action.STAND)
-        
-        # 16 vs 10: Hit (basic strategy)
-        hand = Hand([Card(Rank.TEN), Card(Rank.SIX)])
-        action = self.strategy.get_action(hand, 10)
-        self.assertEqual(action, Action.HIT)
-        
-        # 9 vs 2: Hit (not double)
-        hand = Hand([Card(Rank.FIVE), Card(Rank.FOUR)])
-        action = self.strategy.get_action(hand, 2)
-        self.assertEqual(action, Action.HIT)
-        
-        # 9 vs 3: Double
-        hand = Hand([Card(Rank.FIVE), Card(Rank.FOUR)])
-        action = self.strategy.get_action(hand, 3)
-        self.assertEqual(action, Action.DOUBLE)
+        self._check_cases(SPECIFIC_CASES)
     
     def test_insurance_basic_strategy(self):
         """Test insurance basic strategy (always no)."""
@@ -155,6 +128,44 @@ class TestCountAccuracy(unittest.TestCase):
         for rank in [Rank.TEN, Rank.JACK, Rank.QUEEN, Rank.KING, Rank.ACE]:
             card = Card(rank)
             self.assertEqual(card.hi_lo_value, -1, f"{rank} should be -1")
+    
+    def test_card_parsing(self):
+        """Test card parsing returns shared canonical cards."""
+        self.assertIs(Card.from_string("10"), Card.from_string("t"))
+        self.assertEqual(Card.from_string("K"), Card(Rank.KING))
+        self.assertIs(Card.from_string("K"), Card(Rank.KING))
+        self.assertEqual(str(Card.from_string("a")), "A")
+        with self.assertRaises(ValueError):
+            Card.from_string("X")
+        for bad in (13, -1, "A"):
+            with self.assertRaises(ValueError):
+                Card(bad)
+        self.assertIs(pickle.loads(pickle.dumps(Card(Rank.ACE))), CARDS[Rank.ACE])
+    
+    def test_shoe_deal_and_undeal(self):
+        """Test shoe per-rank tracking and running count."""
+        shoe = Shoe(num_decks=6)
+        for rank in [Rank.TWO, Rank.FIVE, Rank.KING, Rank.FIVE]:
+            shoe.deal_card(Card(rank))
+        
+        self.assertEqual(shoe.running_count, 2)
+        self.assertEqual(shoe.num_dealt, 4)
+        self.assertEqual(shoe.dealt_counts[Rank.FIVE], 2)
+        self.assertEqual(shoe.cards_remaining, 6 * 52 - 4)
+        
+        self.assertTrue(shoe.undeal_card(Card(Rank.KING)))
+        self.assertEqual(shoe.running_count, 3)
+        self.assertFalse(shoe.undeal_card(Card(Rank.ACE)))
+        self.assertEqual(shoe.num_dealt, 3)
+        
+        shoe.deal_rank(Rank.ACE)
+        self.assertEqual(shoe.running_count, 2)
+        self.assertEqual(shoe.dealt_counts[Rank.ACE], 1)
+        
+        info = shoe.get_count_info()
+        self.assertEqual(info.running_count, 2)
+        self.assertEqual(info.cards_dealt, 4)
+        self.assertIs(shoe.get_count_info(), info)
 
 
 class TestHandEvaluation(unittest.TestCase):
@@ -187,10 +198,12 @@ class TestHandEvaluation(unittest.TestCase):
         # Same value different rank (10-value cards)
         hand = Hand([Card(Rank.TEN), Card(Rank.KING)])
         self.assertTrue(hand.is_pair)  # Both worth 10
+        self.assertEqual(hand.pair_value, 10)
         
         # Not pairs
         hand = Hand([Card(Rank.EIGHT), Card(Rank.NINE)])
         self.assertFalse(hand.is_pair)
+        self.assertIsNone(hand.pair_value)
     
     def test_blackjack_detection(self):
         """Test blackjack detection."""
@@ -203,6 +216,180 @@ class TestHandEvaluation(unittest.TestCase):
         hand = Hand([Card(Rank.SEVEN), Card(Rank.SEVEN), Card(Rank.SEVEN)])
         self.assertFalse(hand.is_blackjack)
         self.assertEqual(hand.total, 21)
+    
+    def test_total_updates_with_cards(self):
+        """Test cached totals follow cards being added and removed."""
+        hand = Hand([Card(Rank.ACE), Card(Rank.SIX)])  # Soft 17
+        self.assertEqual(hand.total, 17)
+        self.assertTrue(hand.is_soft)
+        
+        hand.add_card(Card(Rank.NINE))  # A,6,9 = Hard 16
+        self.assertEqual(hand.total, 16)
+        self.assertTrue(hand.is_hard)
+        
+        hand.pop_card()  # Back to Soft 17
+        self.assertEqual(hand.total, 17)
+        self.assertTrue(hand.is_soft)
+        
+        hand.add_rank(Rank.ACE)  # A,6,A = Soft 18
+        self.assertEqual(hand.total, 18)
+        self.assertEqual(hand.ace_count, 2)
+    
+    def test_hand_signature(self):
+        """Test the packed signature tracks total, softness and pairs."""
+        hand = Hand([Card(Rank.ACE), Card(Rank.SIX)])  # Soft 17
+        self.assertEqual(hand.sig, 17 | SIG_SOFT)
+        
+        hand.add_card(Card(Rank.NINE))  # Hard 16
+        self.assertEqual(hand.sig, 16)
+        
+        hand = Hand([Card(Rank.TEN), Card(Rank.KING)])  # Pair of 10s
+        self.assertEqual(hand.sig, 20 | SIG_PAIR | (10 << SIG_PAIR_VALUE_SHIFT))
+        self.assertEqual(hand.sig, Hand([Card(Rank.JACK), Card(Rank.QUEEN)]).sig)
+    
+    def test_dealer_hand_tracking(self):
+        """Test dealer hand follows upcard, hole card and hits."""
+        dealer = DealerHand()
+        dealer.set_upcard(Card(Rank.SIX))
+        dealer.set_hole_card(Card(Rank.FIVE))
+        dealer.add_hit_card(Card(Rank.ACE))  # 6,5,A = Hard 12
+        self.assertEqual(dealer.hand.total, 12)
+        
+        dealer.pop_hit_card()
+        self.assertEqual(dealer.hand.total, 11)
+        
+        dealer.clear_hole_card()
+        self.assertEqual(dealer.hand.total, 6)
+        self.assertEqual(dealer.describe(), "Dealer: [6,?]")
+    
+    def test_seat_split(self):
+        """Test a seat moves from one hand to split hands."""
+        seat = Seat("Me", is_user=True)
+        seat.add_card(Card(Rank.EIGHT))
+        seat.add_card(Card(Rank.EIGHT))
+        self.assertFalse(seat.has_splits)
+        self.assertTrue(seat.can_split())
+        
+        seat.split_hand()
+        self.assertTrue(seat.has_splits)
+        self.assertEqual([hand.total for hand in seat.all_hands], [8, 8])
+        
+        seat.add_card(Card(Rank.THREE))
+        self.assertEqual(seat.primary_hand.total, 11)
+        
+        seat.hands.complete_current_hand()
+        self.assertFalse(seat.hands.is_complete)
+        self.assertEqual(seat.hands.current_hand_index, 1)
+        seat.hands.complete_current_hand()
+        self.assertTrue(seat.hands.is_complete)
+    
+    def test_table_status_refreshes(self):
+        """Test cached table status follows cards dealt and taken back."""
+        table = Table()
+        table.add_seat("Me", is_user=True)
+        table.start_round()
+        status = table.get_status()
+        self.assertIs(table.get_status(), status)
+        
+        table.add_card_to_player("Me", Card(Rank.FIVE))
+        self.assertIn("RC +1", table.get_status())
+        
+        # Edits made outside the table still show once the shoe moves
+        table.get_user_seat().primary_hand.pop_card()
+        table.shoe.undeal_card(Card(Rank.FIVE))
+        self.assertEqual(table.get_status(), status)
+        
+        # So do changes made through the seat itself
+        seat = table.get_user_seat()
+        seat.add_card(Card(Rank.EIGHT))
+        seat.add_card(Card(Rank.EIGHT))
+        self.assertIn("Pair of 8s", table.get_status())
+        seat.split_hand()
+        self.assertIn("Hand 1: [8] - Hard 8 *", table.get_status())
+        seat.hands.complete_current_hand()
+        self.assertIn("Hand 2: [8] - Hard 8 *", table.get_status())
+    
+    def test_table_split_cards(self):
+        """Test cards dealt to split hands land on the chosen hand and count."""
+        table = Table()
+        table.add_seat("Me", is_user=True)
+        table.start_round()
+        table.add_card_to_player("Me", Card(Rank.EIGHT))
+        table.add_card_to_player("Me", Card(Rank.EIGHT))
+        table.split_player_hand("Me")
+        
+        table.add_card_to_split("Me", 1, Card(Rank.THREE))
+        seat = table.get_user_seat()
+        self.assertEqual([hand.total for hand in seat.all_hands], [8, 11])
+        self.assertEqual(table.shoe.running_count, 1)
+        self.assertIn("RC +1", table.get_status())
+
+
+class TestIndexPlays(unittest.TestCase):
+    """Test index play lookup."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.index_plays = IndexPlays()
+    
+    def test_situations_are_unique(self):
+        """Test no two plays share a (total, upcard, soft, pair) situation."""
+        situations = [(play.player_total, play.dealer_upcard, play.is_soft, play.is_pair)
+                      for play in self.index_plays.plays]
+        self.assertEqual(len(situations), len(set(situations)))
+    
+    def test_first_applicable(self):
+        """Test the single applicable play follows the count threshold."""
+        hand = Hand([Card(Rank.TEN), Card(Rank.SIX)])  # 16 vs 10, stand at TC >= 0
+        play = self.index_plays.get_first_applicable(hand, 10, 0.5)
+        self.assertEqual(play.name, "16 vs 10")
+        self.assertEqual(self.index_plays.get_applicable_plays(hand, 10, 0.5), [play])
+        self.assertIsNone(self.index_plays.get_first_applicable(hand, 10, -0.5))
+
+
+class TestAdvisorBatch(unittest.TestCase):
+    """Test batch advice matches per-hand advice, and the advice result."""
+    
+    def test_batch_matches_single_advice(self):
+        """Test each batched action equals get_advice's action."""
+        advisor = Advisor()
+        hands = [
+            Hand([Card(Rank.TEN), Card(Rank.SIX)]),    # 16 vs 10 deviation
+            Hand([Card(Rank.ACE), Card(Rank.SEVEN)]),  # Soft 18
+            Hand([Card(Rank.EIGHT), Card(Rank.EIGHT)]),
+            Hand([Card(Rank.FIVE), Card(Rank.SIX)]),
+        ]
+        for true_count in (-2.0, 0.0, 4.0):
+            for can_double, can_split in ((True, True), (False, False)):
+                actions = advisor.get_advice_batch(hands, 10, true_count, can_double, can_split)
+                expected = [advisor.get_advice(hand, 10, true_count, can_double, can_split).action
+                            for hand in hands]
+                self.assertEqual(actions, expected)
+    
+    def test_advice_result_fields(self):
+        """Test advice reads as attributes or items, with reasoning on demand."""
+        advisor = Advisor()
+        hand = Hand([Card(Rank.TEN), Card(Rank.SIX)])
+        advice = advisor.get_advice(hand, 10, 1.0)  # 16 vs 10 stands at TC 0+
+        self.assertIs(advice.action, Action.STAND)
+        self.assertIs(advice['basic_strategy'], Action.HIT)
+        self.assertEqual(advice['deviation'], advice.deviation)
+        self.assertIn('deviation', advice)
+        self.assertIn("COUNT DEVIATION", advice.reasoning)
+        
+        hand = Hand([Card(Rank.ACE), Card(Rank.SEVEN)])
+        advice = advisor.get_advice(hand, 9, 0.0)
+        hand.add_card(Card(Rank.TWO))  # Later changes don't leak into reasoning
+        self.assertIn("A,7 vs dealer 9", str(advice))
+        self.assertIsNone(advice.get('deviation'))
+        self.assertNotIn('deviation', advice)
+        self.assertNotIn(0, advice)
+        self.assertEqual(dict(advice)['action'], advice.action)
+        self.assertEqual(list(advice), list(advice.keys()))
+        with self.assertRaises(KeyError):
+            advice['deviation']
+        with self.assertRaises(KeyError):
+            advice['_reasoning']
 
 
 if __name__ == "__main__":
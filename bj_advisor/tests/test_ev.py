@@ -0,0 +1,54 @@
+"""
+Unit tests for composition-dependent expected values.
+"""
+import unittest
+from src.core import Hand, Card, Rank, Shoe
+from src.strategy import Advisor
+from src.strategy.ev import remaining_counts, dealer_probabilities, stand_ev, BUST
+
+
+class TestDealerProbabilities(unittest.TestCase):
+    """Test dealer outcome probabilities."""
+    
+    def test_full_shoe_counts(self):
+        """Test remaining counts for an untouched shoe."""
+        counts = remaining_counts([0] * 13, 6)
+        self.assertEqual(counts, [24] * 8 + [96, 24])
+    
+    def test_probabilities_sum_to_one(self):
+        """Test every upcard yields a complete distribution."""
+        counts = remaining_counts([0] * 13, 6)
+        for upcard in range(2, 12):
+            probs = dealer_probabilities(upcard, counts)
+            self.assertAlmostEqual(sum(probs), 1.0, places=9)
+    
+    def test_bust_card_busts_more(self):
+        """Test dealer busts more often showing 6 than 10."""
+        counts = remaining_counts([0] * 13, 6)
+        self.assertGreater(dealer_probabilities(6, counts)[BUST],
+                           dealer_probabilities(10, counts)[BUST])
+    
+    def test_stand_ev_bounds(self):
+        """Test stand EV extremes."""
+        probs = [0.0, 0.0, 0.0, 0.0, 0.0, 1.0]
+        self.assertEqual(stand_ev(12, probs), 1.0)
+        self.assertEqual(stand_ev(22, probs), -1.0)
+
+
+class TestAdvisorExpectedValues(unittest.TestCase):
+    """Test advisor EV integration with the shoe."""
+    
+    def test_double_eleven_vs_six(self):
+        """Test doubling 11 vs 6 beats hitting and standing."""
+        shoe = Shoe(num_decks=6)
+        hand = Hand([Card(Rank.FIVE), Card(Rank.SIX)])
+        for card in hand.cards + [Card(Rank.SIX)]:
+            shoe.deal_card(card)
+        
+        evs = Advisor().get_expected_values(hand, 6, shoe)
+        self.assertGreater(evs['double'], evs['hit'])
+        self.assertGreater(evs['hit'], evs['stand'])
+
+
+if __name__ == "__main__":
+    unittest.main()
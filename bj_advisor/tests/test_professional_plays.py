@@ -75,13 +75,13 @@ def test_professional_index_plays():
         # Display comprehensive advice - showing simplified output for now
         print(f'Hand: {hand.total} vs dealer {case["dealer"]}')
         print(f'True Count: TC {case["count"]:+.1f}')
-        print(f'Basic Strategy: {advice["basic_strategy"].value.upper()}')
-        print(f'Final Action: {advice["action"].value.upper()}')
-        print(f'Count Influenced: {"YES" if advice["count_influenced"] else "NO"}')
+        print(f'Basic Strategy: {advice.basic_strategy.value.upper()}')
+        print(f'Final Action: {advice.action.value.upper()}')
+        print(f'Count Influenced: {"YES" if advice.count_influenced else "NO"}')
         
         # Show change if count influenced
-        if advice["count_influenced"]:
-            print(f'Deviation: {advice["basic_strategy"].value.upper()} -> {advice["action"].value.upper()}')
+        if advice.count_influenced:
+            print(f'Deviation: {advice.basic_strategy.value.upper()} -> {advice.action.value.upper()}')
     
     # Summary statistics
     print(f'\n' + '='*50)